@@ -0,0 +1,28 @@
+from django.contrib import admin
+
+from escrow_backend.db_router import ReplicaChangeListMixin
+
+from .models import BrokerRequest
+from .services import review_broker_requests
+
+
+@admin.register(BrokerRequest)
+class BrokerRequestAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
+    list_display = ('user', 'status', 'created_at', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('user__email',)
+    list_select_related = ('user',)
+    readonly_fields = ('user', 'status', 'created_at', 'updated_at')
+    actions = ('approve_requests', 'reject_requests')
+
+    @admin.action(description='Approve selected broker requests')
+    def approve_requests(self, request, queryset):
+        self.review(request, queryset, BrokerRequest.Status.APPROVED)
+
+    @admin.action(description='Reject selected broker requests')
+    def reject_requests(self, request, queryset):
+        self.review(request, queryset, BrokerRequest.Status.REJECTED)
+
+    def review(self, request, queryset, status):
+        reviewed = review_broker_requests(list(queryset.values_list('pk', flat=True)), status)
+        self.message_user(request, f'{len(reviewed)} broker request(s) marked {status.label.lower()}.')
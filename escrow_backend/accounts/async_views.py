@@ -0,0 +1,20 @@
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from escrow_backend.async_views import AsyncAPIView, json_response
+from escrow_backend.query_budget import query_budget
+
+from .cache import aget_user_entry
+
+
+class MeView(AsyncAPIView):
+    @query_budget(2)
+    async def get(self, request):
+        entry = await aget_user_entry(request.user)
+        headers = {'ETag': entry['etag']}
+
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if entry['etag'] in if_none_match or '*' in if_none_match:
+            return HttpResponseNotModified(headers=headers)
+
+        return json_response(entry['data'], headers=headers)
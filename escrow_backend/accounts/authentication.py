@@ -0,0 +1,75 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import aget_auth_state, get_auth_state
+from .models import User
+
+CLAIM_FIELDS = ('email', 'is_broker', 'is_active')
+
+
+def build_claims_user(validated_token):
+    user_id_field = User._meta.get_field(api_settings.USER_ID_FIELD)
+    claims = {user_id_field.attname: user_id_field.to_python(validated_token[api_settings.USER_ID_CLAIM])}
+    claims.update({field: validated_token[field] for field in CLAIM_FIELDS})
+
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in claims]
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, [claims[name] for name in field_names])
+
+
+def has_stateless_claims(validated_token):
+    return 'auth_version' in validated_token and all(field in validated_token for field in CLAIM_FIELDS)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+    def check_auth_state(self, state, validated_token):
+        if state is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if state['auth_version'] != validated_token['auth_version']:
+            return False
+        if not state['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return True
+
+    def get_user(self, validated_token):
+        if not has_stateless_claims(validated_token):
+            return super().get_user(validated_token)
+
+        state = get_auth_state(self.get_user_id(validated_token))
+        if not self.check_auth_state(state, validated_token):
+            return super().get_user(validated_token)
+        return build_claims_user(validated_token)
+
+    async def aget_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        if has_stateless_claims(validated_token):
+            state = await aget_auth_state(user_id)
+            if self.check_auth_state(state, validated_token):
+                return build_claims_user(validated_token)
+
+        user = await User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).afirst()
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
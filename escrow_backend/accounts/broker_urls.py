@@ -1,7 +1,11 @@
 from django.urls import path
+from rest_framework.routers import DefaultRouter
 
-from .views import BrokerRequestView
+from .views import BrokerRequestReviewViewSet, BrokerRequestView
+
+router = DefaultRouter()
+router.register('broker-requests', BrokerRequestReviewViewSet, basename='broker-request')
 
 urlpatterns = [
     path('request-broker/', BrokerRequestView.as_view(), name='request-broker'),
-]
+] + router.urls
@@ -0,0 +1,91 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def user_cache_key(user_id):
+    return f'accounts:user:{user_id}'
+
+
+def auth_state_cache_key(user_id):
+    return f'accounts:auth:{user_id}'
+
+
+def auth_version(updated_at):
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+def build_user_entry(user):
+    from .serializers import UserSerializer
+
+    data = UserSerializer(user).data
+    body = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    return {
+        'data': data,
+        'etag': '"' + hashlib.sha256(body.encode('utf-8')).hexdigest()[:32] + '"',
+    }
+
+
+async def aget_user_entry(user):
+    from .models import User
+
+    key = user_cache_key(user.pk)
+    entry = await cache.aget(key, version=settings.USER_CACHE_VERSION)
+    if entry is None:
+        entry = build_user_entry(await User.objects.aget(pk=user.pk))
+        await cache.aset(key, entry, settings.USER_CACHE_TIMEOUT, version=settings.USER_CACHE_VERSION)
+    return entry
+
+
+def auth_state_queryset(user_id):
+    from .models import User
+
+    return User.objects.filter(pk=user_id).values('is_active', 'is_broker', 'updated_at')
+
+
+def build_auth_state(row):
+    return {
+        'is_active': row['is_active'],
+        'is_broker': row['is_broker'],
+        'auth_version': auth_version(row['updated_at']),
+    }
+
+
+def get_auth_state(user_id):
+    key = auth_state_cache_key(user_id)
+    state = cache.get(key, version=settings.USER_CACHE_VERSION)
+    if state is None:
+        row = auth_state_queryset(user_id).first()
+        if row is None:
+            return None
+        state = build_auth_state(row)
+        cache.set(key, state, settings.USER_CACHE_TIMEOUT, version=settings.USER_CACHE_VERSION)
+    return state
+
+
+async def aget_auth_state(user_id):
+    key = auth_state_cache_key(user_id)
+    state = await cache.aget(key, version=settings.USER_CACHE_VERSION)
+    if state is None:
+        row = await auth_state_queryset(user_id).afirst()
+        if row is None:
+            return None
+        state = build_auth_state(row)
+        await cache.aset(key, state, settings.USER_CACHE_TIMEOUT, version=settings.USER_CACHE_VERSION)
+    return state
+
+
+def is_broker(user):
+    if not user or not user.is_authenticated:
+        return False
+    state = get_auth_state(user.pk)
+    return bool(state and state['is_broker'])
+
+
+def invalidate_users(user_ids):
+    keys = [key for user_id in user_ids for key in (user_cache_key(user_id), auth_state_cache_key(user_id))]
+    if keys:
+        cache.delete_many(keys, version=settings.USER_CACHE_VERSION)
@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = settings.PASSWORD_HASHER_PARAMS['pbkdf2']['iterations'] or PBKDF2PasswordHasher.iterations
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    work_factor = settings.PASSWORD_HASHER_PARAMS['scrypt']['work_factor']
+    block_size = settings.PASSWORD_HASHER_PARAMS['scrypt']['block_size']
+    parallelism = settings.PASSWORD_HASHER_PARAMS['scrypt']['parallelism']
@@ -0,0 +1,34 @@
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+_login_slots = {}
+_login_slots_lock = threading.Lock()
+
+
+class LoginCapacityExceeded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many sign-ins in progress. Please retry shortly.'
+    default_code = 'login_capacity_exceeded'
+
+
+def get_login_slots():
+    capacity = settings.LOGIN_MAX_CONCURRENCY
+    with _login_slots_lock:
+        if capacity not in _login_slots:
+            _login_slots[capacity] = threading.BoundedSemaphore(capacity)
+        return _login_slots[capacity]
+
+
+@contextmanager
+def login_slot():
+    slots = get_login_slots()
+    if not slots.acquire(timeout=settings.LOGIN_SLOT_TIMEOUT):
+        raise LoginCapacityExceeded()
+    try:
+        yield
+    finally:
+        slots.release()
@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = 'Measure single-core password verifications per second for each configured hasher.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=3.0, help='Time budget per hasher.')
+        parser.add_argument(
+            '--hasher',
+            action='append',
+            dest='hashers',
+            help='Hasher key from PASSWORD_HASHER_CHOICES. Repeatable. Defaults to all of them.',
+        )
+
+    def handle(self, *args, **options):
+        keys = options['hashers'] or list(settings.PASSWORD_HASHER_CHOICES)
+        preferred = get_hasher().algorithm
+
+        for key in keys:
+            hasher = import_string(settings.PASSWORD_HASHER_CHOICES[key])()
+            try:
+                encoded = hasher.encode('benchmark-password', hasher.salt())
+            except ValueError as exc:
+                self.stdout.write(self.style.WARNING(f'{key}: skipped ({exc})'))
+                continue
+
+            rounds = 0
+            started = time.perf_counter()
+            deadline = started + options['seconds']
+            while time.perf_counter() < deadline:
+                hasher.verify('benchmark-password', encoded)
+                rounds += 1
+            elapsed = time.perf_counter() - started
+
+            marker = ' (preferred)' if hasher.algorithm == preferred else ''
+            self.stdout.write(
+                f'{key}{marker}: {rounds / elapsed:.1f} logins/sec/core '
+                f'({elapsed / rounds * 1000:.1f} ms per verify)'
+            )
@@ -0,0 +1,34 @@
+import asyncio
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from accounts.tokens import EscrowRefreshToken
+from escrow_backend.loadtest import format_result, load_test
+
+PATHS = {'me': '/api/auth/me/', 'escrows': '/api/escrows/'}
+
+
+class Command(BaseCommand):
+    help = 'Compare req/s on me and escrows with stateless claim tokens and with tokens that load the User row.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', required=True, help='User to authenticate as.')
+        parser.add_argument('--requests', type=int, default=500, help='Requests per run.')
+        parser.add_argument('--concurrency', type=int, default=1)
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options['email']).first()
+        if user is None:
+            raise CommandError(f'No user with email {options["email"]}.')
+
+        tokens = {
+            'user row': RefreshToken.for_user(user).access_token,
+            'stateless': EscrowRefreshToken.for_user(user).access_token,
+        }
+        for path_label, path in PATHS.items():
+            for token_label, token in tokens.items():
+                headers = {'Authorization': f'Bearer {token}'}
+                result = asyncio.run(load_test(path, options['requests'], options['concurrency'], headers))
+                self.stdout.write(format_result(f'{path_label} ({token_label})', result))
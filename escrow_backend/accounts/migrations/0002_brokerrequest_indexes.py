@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:49
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='brokerrequest',
+            index=models.Index(fields=['user', 'status'], name='broker_req_user_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='brokerrequest',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['created_at', 'id'], name='broker_req_pending_idx'),
+        ),
+    ]
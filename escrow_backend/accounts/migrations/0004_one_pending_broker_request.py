@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:17
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def reject_duplicate_pending_requests(apps, schema_editor):
+    BrokerRequest = apps.get_model('accounts', 'BrokerRequest')
+    older_pending = BrokerRequest.objects.filter(
+        user=models.OuterRef('user'),
+        status='PENDING',
+    ).filter(
+        models.Q(created_at__lt=models.OuterRef('created_at'))
+        | models.Q(created_at=models.OuterRef('created_at'), pk__lt=models.OuterRef('pk'))
+    )
+    BrokerRequest.objects.filter(status='PENDING').filter(models.Exists(older_pending)).update(
+        status='REJECTED',
+        updated_at=timezone.now(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(reject_duplicate_pending_requests, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='brokerrequest',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'PENDING')), fields=('user',), name='broker_req_one_pending_per_user'),
+        ),
+    ]
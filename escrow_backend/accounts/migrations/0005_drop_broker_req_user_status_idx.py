@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:33
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0004_one_pending_broker_request'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='brokerrequest',
+            name='broker_req_user_status_idx',
+        ),
+    ]
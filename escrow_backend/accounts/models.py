@@ -1,6 +1,8 @@
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
@@ -49,6 +51,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = 'user'
         verbose_name_plural = 'users'
+        indexes = [
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='user_email_trgm_idx'),
+        ]
 
     def __str__(self):
         return self.email
@@ -65,5 +70,21 @@ class BrokerRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['created_at', 'id'],
+                condition=models.Q(status='PENDING'),
+                name='broker_req_pending_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=models.Q(status='PENDING'),
+                name='broker_req_one_pending_per_user',
+            ),
+        ]
+
     def __str__(self):
         return f"BrokerRequest(id={self.id}, user={self.user_id}, status={self.status})"
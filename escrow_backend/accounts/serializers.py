@@ -1,8 +1,9 @@
 from django.contrib.auth import authenticate
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from .limits import login_slot
 from .models import BrokerRequest, User
+from .tokens import EscrowRefreshToken
 
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -19,7 +20,7 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        refresh = RefreshToken.for_user(instance)
+        refresh = EscrowRefreshToken.for_user(instance)
         data.update({
             'access': str(refresh.access_token),
             'refresh': str(refresh),
@@ -37,13 +38,14 @@ class LoginSerializer(serializers.Serializer):
         email = attrs.get('email')
         password = attrs.get('password')
 
-        user = authenticate(email=email, password=password)
+        with login_slot():
+            user = authenticate(email=email, password=password)
         if not user:
             raise serializers.ValidationError('Invalid credentials provided.')
         if not user.is_active:
             raise serializers.ValidationError('User account is disabled.')
 
-        refresh = RefreshToken.for_user(user)
+        refresh = EscrowRefreshToken.for_user(user)
         attrs['access'] = str(refresh.access_token)
         attrs['refresh'] = str(refresh)
         return attrs
@@ -68,3 +70,31 @@ class BrokerRequestSerializer(serializers.ModelSerializer):
             'updated_at',
         )
         read_only_fields = fields
+
+
+class BrokerRequestQueueSerializer(serializers.ModelSerializer):
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    email = serializers.EmailField(source='user.email', read_only=True)
+    full_name = serializers.CharField(source='user.full_name', read_only=True)
+
+    class Meta:
+        model = BrokerRequest
+        fields = (
+            'id',
+            'user',
+            'email',
+            'full_name',
+            'status',
+            'created_at',
+        )
+        read_only_fields = fields
+
+
+class BrokerRequestReviewSerializer(serializers.Serializer):
+    MAX_IDS = 500
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_IDS,
+    )
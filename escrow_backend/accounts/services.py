@@ -0,0 +1,24 @@
+from django.db import transaction as db_transaction
+from django.utils import timezone
+
+from .cache import invalidate_users
+from .models import BrokerRequest, User
+
+
+def review_broker_requests(request_ids, status):
+    now = timezone.now()
+    with db_transaction.atomic():
+        reviewed = dict(
+            BrokerRequest.objects.select_for_update()
+            .filter(pk__in=request_ids, status=BrokerRequest.Status.PENDING)
+            .values_list('pk', 'user_id')
+        )
+        if not reviewed:
+            return []
+
+        BrokerRequest.objects.filter(pk__in=reviewed).update(status=status, updated_at=now)
+        if status == BrokerRequest.Status.APPROVED:
+            user_ids = set(reviewed.values())
+            User.objects.filter(pk__in=user_ids).update(is_broker=True, updated_at=now)
+            db_transaction.on_commit(lambda: invalidate_users(user_ids))
+    return sorted(reviewed)
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_users
+from .models import BrokerRequest, User
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    invalidate_users([instance.pk])
+
+
+@receiver(post_save, sender=BrokerRequest)
+def invalidate_user_cache_on_broker_approval(sender, instance, **kwargs):
+    if instance.status == BrokerRequest.Status.APPROVED:
+        invalidate_users([instance.user_id])
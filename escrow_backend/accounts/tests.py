@@ -0,0 +1,152 @@
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+
+from escrow_backend.testing import (
+    QueryBudgetAssertionsMixin,
+    QueryPlanAssertionsMixin,
+    authenticated_client,
+    run_concurrently,
+)
+
+from .limits import get_login_slots
+from .models import BrokerRequest, User
+
+
+class QueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('applicant@example.com', 'password123')
+        BrokerRequest.objects.create(user=cls.user)
+
+    def test_pending_queue_uses_partial_index(self):
+        queryset = BrokerRequest.objects.filter(status=BrokerRequest.Status.PENDING).order_by('created_at', 'id')[:26]
+        self.assertUsesIndex(queryset, 'broker_req_pending_idx', enable_sort='off')
+
+    def test_pending_request_for_user_uses_unique_index(self):
+        queryset = BrokerRequest.objects.filter(user=self.user, status=BrokerRequest.Status.PENDING)
+        self.assertUsesIndex(queryset, 'broker_req_one_pending_per_user')
+
+    def test_requests_for_user_use_foreign_key_index(self):
+        self.assertNoSeqScan(BrokerRequest.objects.filter(user=self.user))
+
+
+class QueryBudgetTests(QueryBudgetAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin@example.com', 'password123')
+        cls.user = User.objects.create_user('applicant@example.com', 'password123')
+        cls.broker_requests = [
+            BrokerRequest.objects.create(user=User.objects.create_user(f'applicant{index}@example.com'))
+            for index in range(3)
+        ]
+
+    def review(self, action):
+        return authenticated_client(self.admin).post(
+            f'/api/accounts/broker-requests/{action}/',
+            {'ids': [broker_request.pk for broker_request in self.broker_requests]},
+            format='json',
+        )
+
+    def test_request_broker(self):
+        response = authenticated_client(self.user).post('/api/accounts/request-broker/', {}, format='json')
+        self.assertWithinQueryBudget(response, 201)
+
+    def test_review_queue(self):
+        self.assertWithinQueryBudget(authenticated_client(self.admin).get('/api/accounts/broker-requests/'))
+
+    def test_approve(self):
+        self.assertWithinQueryBudget(self.review('approve'))
+
+    def test_reject(self):
+        self.assertWithinQueryBudget(self.review('reject'))
+
+    def test_me(self):
+        self.assertWithinQueryBudget(authenticated_client(self.user).get('/api/auth/me/'))
+
+
+class BrokerRequestConcurrencyTests(TransactionTestCase):
+    def test_parallel_requests_create_one_pending_request(self):
+        user = User.objects.create_user('applicant@example.com', 'password123')
+
+        responses = run_concurrently(
+            lambda index: authenticated_client(user).post('/api/accounts/request-broker/', {}, format='json'),
+            16,
+        )
+
+        self.assertEqual(sorted(response.status_code for response in responses), [201] + [400] * 15)
+        self.assertEqual(BrokerRequest.objects.filter(user=user, status=BrokerRequest.Status.PENDING).count(), 1)
+
+
+class BrokerRequestAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin@example.com', 'password123')
+        cls.user = User.objects.create_user('applicant@example.com', 'password123')
+        cls.broker_request = BrokerRequest.objects.create(user=cls.user)
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_change_form_cannot_approve_without_promoting_user(self):
+        response = self.client.post(
+            f'/admin/accounts/brokerrequest/{self.broker_request.pk}/change/',
+            {'status': BrokerRequest.Status.APPROVED},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.broker_request.refresh_from_db()
+        self.assertEqual(self.broker_request.status, BrokerRequest.Status.PENDING)
+
+    def test_approve_action_promotes_user(self):
+        self.client.post(
+            '/admin/accounts/brokerrequest/',
+            {'action': 'approve_requests', '_selected_action': [self.broker_request.pk]},
+        )
+
+        self.broker_request.refresh_from_db()
+        self.user.refresh_from_db()
+        self.assertEqual(self.broker_request.status, BrokerRequest.Status.APPROVED)
+        self.assertTrue(self.user.is_broker)
+
+
+class AsyncAuthenticationErrorTests(TestCase):
+    def assertSameError(self, **headers):
+        sync_response = APIClient().get('/api/kyc/', **headers)
+        async_response = APIClient().get('/api/auth/me/', **headers)
+
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.json(), sync_response.json())
+        self.assertEqual(async_response['WWW-Authenticate'], sync_response['WWW-Authenticate'])
+        return async_response
+
+    def test_missing_credentials_match_drf(self):
+        response = self.assertSameError()
+        self.assertEqual(response.status_code, 401)
+
+    def test_invalid_token_matches_drf(self):
+        response = self.assertSameError(HTTP_AUTHORIZATION='Bearer not-a-token')
+        self.assertEqual(response.json()['code'], 'token_not_valid')
+
+
+class LoginConcurrencyLimitTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user('applicant@example.com', 'password123')
+
+    def login(self):
+        return APIClient().post(
+            '/api/auth/login/', {'email': 'applicant@example.com', 'password': 'password123'}, format='json',
+        )
+
+    @override_settings(LOGIN_MAX_CONCURRENCY=1, LOGIN_SLOT_TIMEOUT=0)
+    def test_login_is_rejected_when_all_slots_are_busy(self):
+        slots = get_login_slots()
+        slots.acquire()
+        try:
+            response = self.login()
+        finally:
+            slots.release()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['detail'], 'Too many sign-ins in progress. Please retry shortly.')
+        self.assertEqual(self.login().status_code, 200)
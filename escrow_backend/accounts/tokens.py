@@ -0,0 +1,14 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .cache import auth_version
+
+
+class EscrowRefreshToken(RefreshToken):
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['email'] = user.email
+        token['is_broker'] = user.is_broker
+        token['is_active'] = user.is_active
+        token['auth_version'] = auth_version(user.updated_at)
+        return token
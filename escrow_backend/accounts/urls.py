@@ -1,6 +1,7 @@
 from django.urls import path
 
-from .views import LoginView, MeView, RegisterView
+from .async_views import MeView
+from .views import LoginView, RegisterView
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='auth-register'),
@@ -1,14 +1,22 @@
-from rest_framework import generics, permissions, status
+from django.db import IntegrityError
+from django.db import transaction as db_transaction
+from rest_framework import generics, mixins, permissions, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from escrow_backend.pagination import QueuePagination
+from escrow_backend.query_budget import query_budget
+
 from .models import BrokerRequest, User
 from .serializers import (
+    BrokerRequestQueueSerializer,
+    BrokerRequestReviewSerializer,
     BrokerRequestSerializer,
     LoginSerializer,
     RegisterSerializer,
-    UserSerializer,
 )
+from .services import review_broker_requests
 
 
 class RegisterView(generics.CreateAPIView):
@@ -26,28 +34,49 @@ class LoginView(APIView):
         return Response(serializer.data)
 
 
-class MeView(generics.RetrieveAPIView):
-    serializer_class = UserSerializer
-    permission_classes = [permissions.IsAuthenticated]
-
-    def get_object(self):
-        return self.request.user
-
-
 class BrokerRequestView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    @query_budget(2)
     def post(self, request, *args, **kwargs):
-        has_pending_request = BrokerRequest.objects.filter(
-            user=request.user, status=BrokerRequest.Status.PENDING
-        ).exists()
-
-        if has_pending_request:
+        try:
+            with db_transaction.atomic():
+                broker_request = BrokerRequest.objects.create(user=request.user)
+        except IntegrityError as exc:
+            constraint = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None)
+            if constraint != 'broker_req_one_pending_per_user':
+                raise
             return Response(
                 {'detail': 'A pending broker request already exists.'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        broker_request = BrokerRequest.objects.create(user=request.user)
         serializer = BrokerRequestSerializer(broker_request)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class BrokerRequestReviewViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    queryset = BrokerRequest.objects.filter(status=BrokerRequest.Status.PENDING).select_related('user')
+    serializer_class = BrokerRequestQueueSerializer
+    permission_classes = [permissions.IsAdminUser]
+    pagination_class = QueuePagination
+
+    @query_budget(3)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @query_budget(5)
+    @action(detail=False, methods=['post'], url_path='approve')
+    def approve(self, request):
+        return self.review(request, BrokerRequest.Status.APPROVED)
+
+    @query_budget(4)
+    @action(detail=False, methods=['post'], url_path='reject')
+    def reject(self, request):
+        return self.review(request, BrokerRequest.Status.REJECTED)
+
+    def review(self, request, review_status):
+        serializer = BrokerRequestReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reviewed = review_broker_requests(serializer.validated_data['ids'], review_status)
+        return Response({'status': review_status, 'ids': reviewed}, status=status.HTTP_200_OK)
@@ -0,0 +1,48 @@
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, AuthenticationFailed, NotAuthenticated
+
+from accounts.authentication import StatelessJWTAuthentication
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    return JsonResponse(data, status=status, headers=headers, encoder=DjangoJSONEncoder, safe=False)
+
+
+class AsyncAPIView(View):
+    http_method_names = ['get']
+    authentication_class = StatelessJWTAuthentication
+    fallback_view = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method.lower() not in self.http_method_names:
+            fallback_view = type(self).fallback_view
+            if fallback_view is not None:
+                return await sync_to_async(fallback_view)(request, *args, **kwargs)
+            return self.http_method_not_allowed(request, *args, **kwargs)
+
+        authentication = self.authentication_class()
+        try:
+            authenticated = await authentication.aauthenticate(request)
+            if authenticated is None:
+                raise NotAuthenticated()
+        except APIException as exc:
+            return self.handle_exception(request, exc, authentication)
+
+        request.user, request.auth = authenticated
+        return await super().dispatch(request, *args, **kwargs)
+
+    def handle_exception(self, request, exc, authentication):
+        headers = {}
+        if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+            headers['WWW-Authenticate'] = authentication.authenticate_header(request)
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        return json_response(data, status=exc.status_code, headers=headers)
@@ -0,0 +1,139 @@
+import random
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_request_writes = ContextVar('request_writes', default=None)
+
+
+def primary_pin_key(user_id):
+    return f'db:primary-pin:{user_id}'
+
+
+def pin_to_primary(user):
+    cache.set(primary_pin_key(user.pk), True, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+async def apin_to_primary(user):
+    await cache.aset(primary_pin_key(user.pk), True, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def is_pinned_to_primary(user):
+    return bool(user and user.is_authenticated and cache.get(primary_pin_key(user.pk)))
+
+
+async def ais_pinned_to_primary(user):
+    return bool(user and user.is_authenticated and await cache.aget(primary_pin_key(user.pk)))
+
+
+@contextmanager
+def _enable_replica_reads(enabled):
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def replica_reads(user=None):
+    with _enable_replica_reads(not is_pinned_to_primary(user)):
+        yield
+
+
+@asynccontextmanager
+async def areplica_reads(user=None):
+    with _enable_replica_reads(not await ais_pinned_to_primary(user)):
+        yield
+
+
+def replica_alias():
+    replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+    if (
+        not replicas
+        or not _replica_reads.get()
+        or _request_writes.get()
+        or connections[DEFAULT_DB_ALIAS].in_atomic_block
+    ):
+        return DEFAULT_DB_ALIAS
+    return random.choice(replicas)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return replica_alias()
+
+    def db_for_write(self, model, **hints):
+        writes = _request_writes.get()
+        if writes is not None:
+            writes.add(model._meta.label)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *getattr(settings, 'DATABASE_REPLICAS', [])}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class PrimaryPinningMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        writes = set()
+        token = _request_writes.set(writes)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_writes.reset(token)
+
+        user = getattr(request, 'user', None)
+        if writes and user is not None and user.is_authenticated:
+            pin_to_primary(user)
+        return response
+
+    async def __acall__(self, request):
+        writes = set()
+        token = _request_writes.set(writes)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_writes.reset(token)
+
+        user = getattr(request, 'user', None)
+        if writes and user is not None and user.is_authenticated:
+            await apin_to_primary(user)
+        return response
+
+
+class ReplicaChangeListMixin:
+    def changelist_view(self, request, extra_context=None):
+        if request.method not in ('GET', 'HEAD'):
+            return super().changelist_view(request, extra_context)
+
+        with replica_reads(request.user):
+            response = super().changelist_view(request, extra_context)
+            if hasattr(response, 'render'):
+                response.render()
+        return response
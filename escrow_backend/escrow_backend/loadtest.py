@@ -0,0 +1,29 @@
+import asyncio
+import statistics
+import time
+
+from django.test import AsyncClient
+
+
+async def load_test(path, requests, concurrency, headers=None):
+    client = AsyncClient(SERVER_NAME='localhost')
+    timings = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f'GET {path} returned {response.status_code}.')
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return len(timings) / elapsed, statistics.quantiles(timings, n=100)
+
+
+def format_result(label, result):
+    throughput, percentiles = result
+    return f'{label}: {throughput:,.0f} req/s, p50 {percentiles[49]:.2f} ms, p99 {percentiles[98]:.2f} ms'
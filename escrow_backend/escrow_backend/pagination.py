@@ -0,0 +1,146 @@
+import base64
+import binascii
+from collections import OrderedDict
+
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.utils.functional import cached_property
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 25
+    max_page_size = 100
+    timestamp_field = 'created_at'
+    descending = True
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def get_ordering(self):
+        prefix = '-' if self.descending else ''
+        return (f'{prefix}{self.timestamp_field}', f'{prefix}id')
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.GET.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, instance):
+        timestamp = getattr(instance, self.timestamp_field)
+        raw = f'{timestamp.isoformat()}|{instance.pk}'
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, request):
+        encoded = request.GET.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            timestamp, pk = raw.rsplit('|', 1)
+            timestamp = parse_datetime(timestamp)
+            pk = int(pk)
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if timestamp is None:
+            raise NotFound(self.invalid_cursor_message)
+        return timestamp, pk
+
+    def filter_queryset(self, queryset, request):
+        queryset = queryset.order_by(*self.get_ordering())
+        cursor = self.decode_cursor(request)
+        if cursor is None:
+            return queryset
+
+        timestamp, pk = cursor
+        lookup = 'lt' if self.descending else 'gt'
+        return queryset.filter(
+            models.Q(**{f'{self.timestamp_field}__{lookup}': timestamp})
+            | models.Q(**{self.timestamp_field: timestamp, f'pk__{lookup}': pk})
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        page = list(self.filter_queryset(queryset, request)[:page_size + 1])
+        return self.finalize_page(page, page_size)
+
+    async def apaginate_queryset(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        page = [obj async for obj in self.filter_queryset(queryset, request)[:page_size + 1]]
+        return self.finalize_page(page, page_size)
+
+    def finalize_page(self, page, page_size):
+        self.has_next = len(page) > page_size
+        page = page[:page_size]
+        self.next_cursor = self.encode_cursor(page[-1]) if self.has_next else None
+        return page
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_data(self, data):
+        return OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ])
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class QueuePagination(KeysetPagination):
+    descending = False
+
+
+class SearchPagination(LimitOffsetPagination):
+    default_limit = 25
+    max_limit = 100
+
+
+def estimated_row_count(model, using):
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where and not query.distinct:
+            estimate = estimated_row_count(self.object_list.model, self.object_list.db)
+            if estimate is not None and estimate >= self.exact_count_threshold:
+                return estimate
+        return super().count
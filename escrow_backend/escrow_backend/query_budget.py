@@ -0,0 +1,156 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('escrow_backend.queries')
+
+_IN_LIST_RE = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SAVEPOINT_RE = re.compile(r'^\s*(?:SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b', re.IGNORECASE)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(max_queries):
+    def decorator(func):
+        func.query_budget = max_queries
+        return func
+    return decorator
+
+
+def fingerprint(sql):
+    sql = _IN_LIST_RE.sub('(%s, ...)', sql)
+    return _WHITESPACE_RE.sub(' ', sql).strip()
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            if not _SAVEPOINT_RE.match(sql):
+                self.count += 1
+                self.fingerprints[fingerprint(sql)] += 1
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stack.close()
+        self._stack = None
+
+    @property
+    def duplicates(self):
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+    def as_dict(self):
+        return {
+            'queries': self.count,
+            'db_ms': round(self.duration * 1000, 2),
+            'duplicates': self.duplicates,
+        }
+
+    def server_timing(self):
+        duplicate_count = sum(count - 1 for count in self.duplicates.values())
+        return (
+            f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries", '
+            f'db-dup;desc="{duplicate_count} duplicate queries"'
+        )
+
+
+def resolve_query_budget(view_func, method):
+    budget = getattr(view_func, 'query_budget', None)
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if view_class is None:
+        return budget
+
+    actions = getattr(view_func, 'actions', None) or {}
+    handler = getattr(view_class, actions.get(method, method), None)
+    fallback_view = getattr(view_class, 'fallback_view', None)
+    if handler is None and fallback_view is not None:
+        return resolve_query_budget(fallback_view, method)
+    return getattr(handler, 'query_budget', budget)
+
+
+def check_query_budget(recorder, budget, label):
+    if budget is None or recorder.count <= budget:
+        return
+
+    message = f'{label} issued {recorder.count} queries (budget {budget}).'
+    if getattr(settings, 'QUERY_BUDGET_STRICT', False):
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+@contextmanager
+def assert_max_queries(budget, label='block'):
+    with QueryRecorder() as recorder:
+        yield recorder
+    if recorder.count > budget:
+        raise QueryBudgetExceeded(
+            f'{label} issued {recorder.count} queries (budget {budget}): {recorder.as_dict()}'
+        )
+
+
+class QueryInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        request.query_budget = None
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+        return self.finalize(request, response, recorder)
+
+    async def __acall__(self, request):
+        request.query_budget = None
+        with QueryRecorder() as recorder:
+            response = await self.get_response(request)
+        return self.finalize(request, response, recorder)
+
+    def finalize(self, request, response, recorder):
+        label = f'{request.method} {request.path}'
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            **recorder.as_dict(),
+        }))
+        if getattr(settings, 'QUERY_INSTRUMENTATION_HEADERS', False):
+            response['Server-Timing'] = recorder.server_timing()
+
+        check_query_budget(recorder, request.query_budget, label)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = resolve_query_budget(view_func, request.method.lower())
+        return None
@@ -17,6 +17,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'accounts',
@@ -25,11 +26,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'escrow_backend.query_budget.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'escrow_backend.db_router.PrimaryPinningMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -54,17 +57,107 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'escrow_backend.wsgi.application'
 
-DATABASES = {
-    'default': {
+DB_POOL = os.getenv('DB_POOL', 'False') == 'True'
+DB_CONN_MAX_AGE = 0 if DB_POOL else int(os.getenv('DB_CONN_MAX_AGE', '60'))
+DB_CONN_HEALTH_CHECKS = os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True'
+DB_OPTIONS = {}
+if DB_POOL:
+    DB_OPTIONS['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+    }
+
+
+def database_settings(host, port):
+    return {
         'ENGINE': 'django.db.backends.postgresql',
         'NAME': os.getenv('POSTGRES_DB', 'your_db_name'),
         'USER': os.getenv('POSTGRES_USER', 'your_db_user'),
         'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'your_db_password'),
-        'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
-        'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        'HOST': host,
+        'PORT': port,
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+        'OPTIONS': dict(DB_OPTIONS),
     }
+
+
+DATABASES = {
+    'default': database_settings(os.getenv('POSTGRES_HOST', 'localhost'), os.getenv('POSTGRES_PORT', '5432')),
 }
 
+for index, replica in enumerate(filter(None, os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',')), start=1):
+    replica_host, _, replica_port = replica.strip().partition(':')
+    DATABASES[f'replica_{index}'] = {
+        **database_settings(replica_host, replica_port or os.getenv('POSTGRES_PORT', '5432')),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['escrow_backend.db_router.ReplicaRouter']
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '10'))
+
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'escrow-backend',
+        }
+    }
+
+KYC_ENCRYPTION_KEYS = [key for key in os.getenv('KYC_ENCRYPTION_KEYS', '').split(',') if key]
+KYC_BLIND_INDEX_KEY = os.getenv('KYC_BLIND_INDEX_KEY', '')
+
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_FILE_PATH = os.getenv('EMAIL_FILE_PATH', str(BASE_DIR / 'sent_emails'))
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '25'))
+EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'False') == 'True'
+EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', '10'))
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'no-reply@easy-escrow.local')
+FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:5173').rstrip('/')
+
+INVITATION_MAX_ATTEMPTS = int(os.getenv('INVITATION_MAX_ATTEMPTS', '5'))
+INVITATION_RETRY_BASE_SECONDS = int(os.getenv('INVITATION_RETRY_BASE_SECONDS', '60'))
+INVITATION_CLAIM_SECONDS = int(os.getenv('INVITATION_CLAIM_SECONDS', '300'))
+# INVITATION_TOKEN_MAX_AGE_DAYS: how long the signed accept link in invitation emails stays valid.
+INVITATION_TOKEN_MAX_AGE = timedelta(days=int(os.getenv('INVITATION_TOKEN_MAX_AGE_DAYS', '7')))
+
+USER_CACHE_TIMEOUT = int(os.getenv('USER_CACHE_TIMEOUT', '300'))
+USER_CACHE_VERSION = 1
+
+PASSWORD_HASHER_CHOICES = {
+    'scrypt': 'accounts.hashers.TunedScryptPasswordHasher',
+    'pbkdf2': 'accounts.hashers.TunedPBKDF2PasswordHasher',
+}
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_HASHERS = [PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    path for key, path in PASSWORD_HASHER_CHOICES.items() if key != PASSWORD_HASHER
+]
+PASSWORD_HASHER_PARAMS = {
+    'pbkdf2': {
+        'iterations': int(os.getenv('PBKDF2_ITERATIONS', '0')) or None,
+    },
+    'scrypt': {
+        'work_factor': int(os.getenv('SCRYPT_WORK_FACTOR', '16384')),
+        'block_size': int(os.getenv('SCRYPT_BLOCK_SIZE', '8')),
+        'parallelism': int(os.getenv('SCRYPT_PARALLELISM', '1')),
+    },
+}
+
+LOGIN_MAX_CONCURRENCY = int(os.getenv('LOGIN_MAX_CONCURRENCY', str(os.cpu_count() or 1)))
+LOGIN_SLOT_TIMEOUT = float(os.getenv('LOGIN_SLOT_TIMEOUT', '2'))
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -85,13 +178,34 @@ AUTH_USER_MODEL = 'accounts.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.StatelessJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
 }
 
+QUERY_BUDGET_STRICT = os.getenv('QUERY_BUDGET_STRICT', 'False') == 'True'
+TEST_RUNNER = 'escrow_backend.testing.StrictQueryBudgetRunner'
+QUERY_INSTRUMENTATION_HEADERS = os.getenv('QUERY_INSTRUMENTATION_HEADERS', str(DEBUG)) == 'True'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'escrow_backend.queries': {
+            'handlers': ['console'],
+            'level': os.getenv('QUERY_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
+IDEMPOTENCY_KEY_TTL = timedelta(hours=int(os.getenv('IDEMPOTENCY_KEY_TTL_HOURS', '24')))
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
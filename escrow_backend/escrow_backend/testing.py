@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.test.runner import DiscoverRunner
+from rest_framework.test import APIClient
+
+
+class StrictQueryBudgetRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._query_budget_strict = settings.QUERY_BUDGET_STRICT
+        settings.QUERY_BUDGET_STRICT = True
+
+    def teardown_test_environment(self, **kwargs):
+        settings.QUERY_BUDGET_STRICT = self._query_budget_strict
+        super().teardown_test_environment(**kwargs)
+
+
+class QueryPlanAssertionsMixin:
+    def explain(self, queryset, **planner):
+        planner = {'enable_seqscan': 'off', **planner}
+        with connections[queryset.db].cursor() as cursor:
+            for setting, value in planner.items():
+                cursor.execute(f'SET LOCAL {setting} = {value}')
+        return queryset.explain()
+
+    def assertNoSeqScan(self, queryset, **planner):
+        plan = self.explain(queryset, **planner)
+        self.assertNotIn('Seq Scan', plan, plan)
+        return plan
+
+    def assertUsesIndex(self, queryset, index_name, **planner):
+        plan = self.assertNoSeqScan(queryset, **planner)
+        self.assertIn(index_name, plan, plan)
+        return plan
+
+
+class QueryBudgetAssertionsMixin:
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def assertWithinQueryBudget(self, response, status_code=200):
+        request = getattr(response, 'wsgi_request', None) or response.asgi_request
+        self.assertIsNotNone(request.query_budget, f'{request.method} {request.path} has no query budget.')
+        self.assertEqual(response.status_code, status_code, getattr(response, 'data', response.content))
+        return response
+
+
+def authenticated_client(user):
+    from accounts.tokens import EscrowRefreshToken
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {EscrowRefreshToken.for_user(user).access_token}')
+    return client
+
+
+def run_concurrently(func, count):
+    barrier = threading.Barrier(count)
+
+    def run(index):
+        try:
+            barrier.wait()
+            return func(index)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(run, range(count)))
@@ -1,10 +1,13 @@
 from django.contrib import admin
 
-from .models import CommissionSplit, EscrowParticipant, EscrowTransaction
+from escrow_backend.db_router import ReplicaChangeListMixin
+from escrow_backend.pagination import EstimatedCountPaginator
+
+from .models import CommissionSplit, EscrowEvent, EscrowParticipant, EscrowTransaction, InvitationOutbox
 
 
 @admin.register(EscrowTransaction)
-class EscrowTransactionAdmin(admin.ModelAdmin):
+class EscrowTransactionAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
     list_display = (
         'agreement_name',
         'created_by',
@@ -14,20 +17,29 @@ class EscrowTransactionAdmin(admin.ModelAdmin):
         'created_at',
     )
     list_filter = ('status', 'transaction_type', 'property_type', 'currency')
+    list_select_related = ('created_by',)
     search_fields = ('agreement_name', 'property_address', 'created_by__email')
+    raw_id_fields = ('created_by',)
     readonly_fields = ('created_at', 'updated_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(EscrowParticipant)
-class EscrowParticipantAdmin(admin.ModelAdmin):
+class EscrowParticipantAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
     list_display = ('email', 'transaction', 'role', 'has_accepted', 'created_at')
     list_filter = ('role', 'has_accepted')
+    list_select_related = ('transaction',)
     search_fields = ('email', 'transaction__agreement_name')
+    autocomplete_fields = ('transaction',)
+    raw_id_fields = ('user',)
     readonly_fields = ('created_at', 'updated_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(CommissionSplit)
-class CommissionSplitAdmin(admin.ModelAdmin):
+class CommissionSplitAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
     list_display = (
         'transaction',
         'broker',
@@ -36,4 +48,42 @@ class CommissionSplitAdmin(admin.ModelAdmin):
         'co_broker_share_pct',
         'created_at',
     )
+    list_select_related = ('transaction', 'broker', 'co_broker')
+    autocomplete_fields = ('transaction',)
+    raw_id_fields = ('broker', 'co_broker')
     readonly_fields = ('created_at', 'updated_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(EscrowEvent)
+class EscrowEventAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
+    list_display = ('transaction', 'from_status', 'to_status', 'actor', 'created_at')
+    list_filter = ('to_status',)
+    list_select_related = ('transaction', 'actor')
+    readonly_fields = ('transaction', 'from_status', 'to_status', 'actor', 'created_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(InvitationOutbox)
+class InvitationOutboxAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
+    list_display = ('participant', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status',)
+    list_select_related = ('participant',)
+    search_fields = ('participant__email',)
+    readonly_fields = ('participant', 'attempts', 'last_error', 'sent_at', 'created_at', 'updated_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
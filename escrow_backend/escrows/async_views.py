@@ -0,0 +1,31 @@
+from rest_framework import status
+
+from escrow_backend.async_views import AsyncAPIView, json_response
+from escrow_backend.db_router import areplica_reads
+from escrow_backend.pagination import KeysetPagination
+from escrow_backend.query_budget import query_budget
+
+from .serializers import EscrowTransactionListSerializer
+from .services import participant_escrows
+from .views import EscrowTransactionViewSet
+
+
+class AsyncEscrowListView(AsyncAPIView):
+    fallback_view = EscrowTransactionViewSet.as_view({'post': 'create'})
+
+    @query_budget(3)
+    async def get(self, request):
+        paginator = KeysetPagination()
+        async with areplica_reads(request.user):
+            page = await paginator.apaginate_queryset(participant_escrows(request.user), request)
+        data = EscrowTransactionListSerializer(page, many=True).data
+        return json_response(paginator.get_paginated_data(data))
+
+
+class AsyncEscrowDetailView(AsyncAPIView):
+    @query_budget(3)
+    async def get(self, request, pk):
+        escrow = await participant_escrows(request.user).filter(pk=pk).afirst()
+        if escrow is None:
+            return json_response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return json_response(EscrowTransactionListSerializer(escrow).data)
@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+from datetime import datetime, time, timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from escrow_backend.db_router import replica_alias
+
+from .models import EscrowTransaction
+
+EXPORT_COLUMNS = [
+    ('escrow_id', 'id'),
+    ('agreement_name', 'agreement_name'),
+    ('status', 'status'),
+    ('currency', 'currency'),
+    ('transaction_type', 'transaction_type'),
+    ('property_type', 'property_type'),
+    ('property_value', 'property_value'),
+    ('estimated_closing_date', 'estimated_closing_date'),
+    ('property_address', 'property_address'),
+    ('created_by_email', 'created_by__email'),
+    ('created_at', 'created_at'),
+    ('broker_email', 'commission_split__broker__email'),
+    ('co_broker_email', 'commission_split__co_broker__email'),
+    ('broker_share_pct', 'commission_split__broker_share_pct'),
+    ('co_broker_share_pct', 'commission_split__co_broker_share_pct'),
+    ('participant_email', 'participants__email'),
+    ('participant_role', 'participants__role'),
+    ('participant_has_accepted', 'participants__has_accepted'),
+]
+EXPORT_HEADERS = [header for header, _ in EXPORT_COLUMNS]
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+CONTENT_TYPES = {
+    CSV: 'text/csv',
+    NDJSON: 'application/x-ndjson',
+}
+
+CHUNK_SIZE = 2000
+ROWS_PER_WRITE = 500
+
+
+def _start_of_day(value):
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def export_queryset(status=None, currency=None, created_after=None, created_before=None):
+    queryset = EscrowTransaction.objects.using(replica_alias()).order_by('id')
+    if status:
+        queryset = queryset.filter(status=status)
+    if currency:
+        queryset = queryset.filter(currency=currency)
+    if created_after:
+        queryset = queryset.filter(created_at__gte=_start_of_day(created_after))
+    if created_before:
+        queryset = queryset.filter(created_at__lt=_start_of_day(created_before + timedelta(days=1)))
+    return queryset.values_list(*[lookup for _, lookup in EXPORT_COLUMNS])
+
+
+def iter_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_HEADERS)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % ROWS_PER_WRITE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows):
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_HEADERS, row)), cls=DjangoJSONEncoder))
+        if len(lines) == ROWS_PER_WRITE:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def iter_export(queryset, file_format, chunk_size=CHUNK_SIZE):
+    rows = queryset.iterator(chunk_size=chunk_size)
+    if file_format == NDJSON:
+        return iter_ndjson(rows)
+    return iter_csv(rows)
@@ -0,0 +1,95 @@
+import functools
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(request):
+    body = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+    raw = f'{request.method}\n{request.path}\n{body}'
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def claim_key(user, key, fingerprint):
+    try:
+        with db_transaction.atomic():
+            return IdempotencyKey.objects.create(user=user, key=key, request_fingerprint=fingerprint), True
+    except IntegrityError:
+        record = IdempotencyKey.objects.get(user=user, key=key)
+
+    if not record.is_expired:
+        return record, False
+
+    record.delete()
+    return IdempotencyKey.objects.create(user=user, key=key, request_fingerprint=fingerprint), True
+
+
+def purge_expired_keys(batch_size=1000):
+    cutoff = timezone.now() - settings.IDEMPOTENCY_KEY_TTL
+    purged = 0
+    while True:
+        batch = list(
+            IdempotencyKey.objects.filter(created_at__lt=cutoff)
+            .order_by('created_at')
+            .values_list('pk', flat=True)[:batch_size]
+        )
+        if not batch:
+            return purged
+        purged += IdempotencyKey.objects.filter(pk__in=batch).delete()[0]
+
+
+def replay(record, fingerprint):
+    if record.request_fingerprint != fingerprint:
+        return Response(
+            {'detail': 'Idempotency-Key was already used for a different request.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    if record.response_status is None:
+        return Response(
+            {'detail': 'A request with this Idempotency-Key is still being processed.'},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    response = Response(record.response_body, status=record.response_status)
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotent(view_method):
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.META.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'detail': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fingerprint = request_fingerprint(request)
+        with db_transaction.atomic():
+            record, created = claim_key(request.user, key, fingerprint)
+            if not created:
+                return replay(record, fingerprint)
+
+            response = view_method(self, request, *args, **kwargs)
+            record.response_status = response.status_code
+            record.response_body = response.data
+            record.save(update_fields=['response_status', 'response_body'])
+
+        return response
+
+    return wrapper
@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.core.mail import EmailMessage
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from django.utils.timesince import timeuntil
+
+from .models import EscrowRole, InvitationOutbox, InvitationStatus
+
+INVITATION_TOKEN_SALT = 'escrows.invitation'
+
+
+class InvalidInvitationToken(Exception):
+    pass
+
+
+def make_invitation_token(participant):
+    return signing.dumps(
+        [participant.pk, participant.transaction_id],
+        salt=INVITATION_TOKEN_SALT,
+    )
+
+
+def verify_invitation_token(token, transaction_id):
+    try:
+        participant_id, token_transaction_id = signing.loads(
+            token,
+            salt=INVITATION_TOKEN_SALT,
+            max_age=settings.INVITATION_TOKEN_MAX_AGE,
+        )
+    except signing.SignatureExpired:
+        raise InvalidInvitationToken('Invitation token has expired.')
+    except (signing.BadSignature, TypeError, ValueError):
+        raise InvalidInvitationToken('Invalid invitation token.')
+
+    if token_transaction_id != transaction_id:
+        raise InvalidInvitationToken('Invitation token does not belong to this transaction.')
+    return participant_id
+
+
+def enqueue_invitations(participants):
+    InvitationOutbox.objects.bulk_create(
+        [
+            InvitationOutbox(participant=participant)
+            for participant in participants
+            if participant.pk is not None and participant.role != EscrowRole.BROKER
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=settings.INVITATION_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+
+
+def claim_invitations(batch_size):
+    with db_transaction.atomic():
+        invitations = list(
+            InvitationOutbox.objects.select_for_update(skip_locked=True, of=('self',))
+            .select_related('participant__transaction__created_by')
+            .filter(status=InvitationStatus.PENDING, next_attempt_at__lte=timezone.now())
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        if invitations:
+            InvitationOutbox.objects.filter(pk__in=[invitation.pk for invitation in invitations]).update(
+                next_attempt_at=timezone.now() + timedelta(seconds=settings.INVITATION_CLAIM_SECONDS),
+            )
+    return invitations
+
+
+def invitation_link_lifetime():
+    now = timezone.now()
+    return timeuntil(now + settings.INVITATION_TOKEN_MAX_AGE, now)
+
+
+def build_invitation_message(invitation, connection):
+    participant = invitation.participant
+    escrow = participant.transaction
+    inviter = escrow.created_by
+    accept_url = f'{settings.FRONTEND_URL}/escrows/{escrow.pk}/accept?token={make_invitation_token(participant)}'
+    return EmailMessage(
+        subject=f'You have been invited to {escrow.agreement_name}',
+        body=(
+            f'{inviter.full_name or inviter.email} invited you to join the escrow '
+            f'"{escrow.agreement_name}" as {participant.get_role_display().lower()}.\n\n'
+            f'Review and accept it here: {accept_url}\n'
+            f'This link expires in {invitation_link_lifetime()}.\n'
+        ),
+        to=[participant.email],
+        connection=connection,
+    )
+
+
+def deliver_invitations(invitations, connection):
+    now = timezone.now()
+    sent = []
+    failed = []
+    for invitation in invitations:
+        invitation.attempts += 1
+        try:
+            build_invitation_message(invitation, connection).send()
+        except Exception as exc:
+            invitation.last_error = f'{type(exc).__name__}: {exc}'
+            if invitation.attempts >= settings.INVITATION_MAX_ATTEMPTS:
+                invitation.status = InvitationStatus.FAILED
+            else:
+                invitation.next_attempt_at = now + retry_delay(invitation.attempts)
+            failed.append(invitation)
+        else:
+            invitation.status = InvitationStatus.SENT
+            invitation.sent_at = now
+            invitation.last_error = ''
+            sent.append(invitation)
+        invitation.updated_at = now
+
+    InvitationOutbox.objects.bulk_update(
+        sent + failed,
+        ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at', 'updated_at'],
+    )
+    return sent, failed
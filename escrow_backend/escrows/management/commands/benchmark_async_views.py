@@ -0,0 +1,35 @@
+import asyncio
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import User
+from accounts.tokens import EscrowRefreshToken
+from escrow_backend.loadtest import format_result, load_test
+from escrows.services import participant_escrows
+
+
+class Command(BaseCommand):
+    help = 'Load test the async escrow list and detail views through the ASGI handler.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', required=True, help='User to authenticate as.')
+        parser.add_argument('--requests', type=int, default=500, help='Requests per run.')
+        parser.add_argument(
+            '--concurrency', type=int, action='append', dest='concurrency_levels',
+            help='Repeatable. Defaults to 1, 8 and 32 in-flight requests.',
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options['email']).first()
+        if user is None:
+            raise CommandError(f'No user with email {options["email"]}.')
+        escrow = participant_escrows(user).order_by('-created_at', '-id').first()
+        if escrow is None:
+            raise CommandError(f'{user.email} is not part of any escrow.')
+
+        headers = {'Authorization': f'Bearer {EscrowRefreshToken.for_user(user).access_token}'}
+        paths = {'list': '/api/escrows/', 'detail': f'/api/escrows/{escrow.pk}/'}
+        for concurrency in options['concurrency_levels'] or (1, 8, 32):
+            for label, path in paths.items():
+                result = asyncio.run(load_test(path, options['requests'], concurrency, headers))
+                self.stdout.write(format_result(f'{label} x{concurrency}', result))
@@ -0,0 +1,71 @@
+import statistics
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import load_backend
+
+from escrows.models import EscrowTransaction
+
+MODES = ('fresh', 'persistent', 'pool')
+
+
+class Command(BaseCommand):
+    help = 'Measure p50/p99 request latency with fresh, persistent and pooled database connections.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--requests', type=int, default=500, help='Simulated requests per mode.')
+        parser.add_argument('--mode', action='append', dest='modes', choices=MODES, help='Repeatable. Defaults to all.')
+
+    def handle(self, *args, **options):
+        base = connections.settings[options['database']]
+        sql, params = EscrowTransaction.objects.order_by('-created_at', '-id').values('id')[:25].query.sql_with_params()
+
+        for mode in options['modes'] or MODES:
+            try:
+                connection = self.connect(base, mode)
+            except ImproperlyConfigured as exc:
+                self.stdout.write(self.style.WARNING(f'{mode}: skipped ({exc})'))
+                continue
+
+            try:
+                timings = [self.request(connection, sql, params) for _ in range(options['requests'])]
+            finally:
+                connection.close()
+                if mode == 'pool':
+                    connection.close_pool()
+
+            percentiles = statistics.quantiles(timings, n=100)
+            self.stdout.write(
+                f'{mode}: p50 {percentiles[49]:.2f} ms, p99 {percentiles[98]:.2f} ms, '
+                f'mean {statistics.fmean(timings):.2f} ms over {len(timings)} requests'
+            )
+
+    def connect(self, base, mode):
+        db_settings = {**base, 'OPTIONS': {**base['OPTIONS']}}
+        pool_options = db_settings['OPTIONS'].pop('pool', None) or True
+        if mode == 'fresh':
+            db_settings.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+        elif mode == 'persistent':
+            db_settings.update(CONN_MAX_AGE=None, CONN_HEALTH_CHECKS=True)
+        else:
+            if db_settings['ENGINE'] != 'django.db.backends.postgresql':
+                raise ImproperlyConfigured('connection pooling requires PostgreSQL')
+            db_settings.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+            db_settings['OPTIONS']['pool'] = pool_options
+
+        connection = load_backend(db_settings['ENGINE']).DatabaseWrapper(db_settings, f'benchmark_{mode}')
+        if mode == 'pool':
+            connection.pool.open(wait=True)
+        return connection
+
+    def request(self, connection, sql, params):
+        started = time.perf_counter()
+        connection.close_if_unusable_or_obsolete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            cursor.fetchall()
+        connection.close_if_unusable_or_obsolete()
+        return (time.perf_counter() - started) * 1000
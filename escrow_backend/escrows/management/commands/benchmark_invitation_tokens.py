@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from escrows.invitations import make_invitation_token, verify_invitation_token
+from escrows.models import EscrowParticipant
+
+
+class Command(BaseCommand):
+    help = 'Measure invitation token signing and verification throughput.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tokens', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        count = options['tokens']
+        participants = [EscrowParticipant(pk=index, transaction_id=index) for index in range(1, count + 1)]
+
+        tokens = self.measure('sign', count, lambda: [make_invitation_token(participant) for participant in participants])
+        self.measure('verify', count, lambda: [
+            verify_invitation_token(token, participant.transaction_id)
+            for token, participant in zip(tokens, participants)
+        ])
+        self.stdout.write(f'token length: {max(len(token) for token in tokens)} characters')
+
+    def measure(self, label, count, run):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'{label}: {elapsed * 1000:.1f} ms per {count} tokens ({count / elapsed:,.0f} tokens/sec)'
+        )
+        return result
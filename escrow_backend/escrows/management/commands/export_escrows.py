@@ -0,0 +1,46 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from escrow_backend.db_router import replica_reads
+
+from escrows.exports import CHUNK_SIZE, CSV, NDJSON, export_queryset, iter_export
+from escrows.serializers import EscrowExportSerializer
+
+
+class Command(BaseCommand):
+    help = 'Stream escrow transactions with their commission splits and participants as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', dest='file_format', choices=[CSV, NDJSON], default=CSV)
+        parser.add_argument('--status')
+        parser.add_argument('--currency')
+        parser.add_argument('--created-after', help='YYYY-MM-DD, inclusive.')
+        parser.add_argument('--created-before', help='YYYY-MM-DD, inclusive.')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+        parser.add_argument('--output', help='File to write to. Defaults to stdout.')
+
+    def handle(self, *args, **options):
+        params = {
+            key: options[key]
+            for key in ('file_format', 'status', 'currency', 'created_after', 'created_before')
+            if options[key]
+        }
+        serializer = EscrowExportSerializer(data=params)
+        if not serializer.is_valid():
+            raise CommandError(serializer.errors)
+
+        filters = dict(serializer.validated_data)
+        file_format = filters.pop('file_format')
+        with replica_reads():
+            queryset = export_queryset(**filters)
+        chunks = iter_export(queryset, file_format, chunk_size=options['chunk_size'])
+
+        if not options['output']:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            return
+
+        with open(options['output'], 'w', newline='', encoding='utf-8') as handle:
+            for chunk in chunks:
+                handle.write(chunk)
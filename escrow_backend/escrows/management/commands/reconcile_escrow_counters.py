@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from escrows.models import EscrowTransaction
+from escrows.services import participant_counter_drift, refresh_participant_counters
+
+
+class Command(BaseCommand):
+    help = 'Repair drift between the denormalized participant counters and the participant rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many escrows have drifted.')
+
+    def handle(self, *args, **options):
+        drifted = EscrowTransaction.objects.filter(participant_counter_drift())
+
+        if options['dry_run']:
+            self.stdout.write(f'{drifted.count()} escrow(s) with counter drift.')
+            return
+
+        repaired = refresh_participant_counters(drifted)
+        self.stdout.write(self.style.SUCCESS(f'Repaired counters on {repaired} escrow(s).'))
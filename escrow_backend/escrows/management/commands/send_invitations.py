@@ -0,0 +1,63 @@
+import signal
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from escrows.invitations import claim_invitations, deliver_invitations
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued invitation emails from the outbox.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds to sleep when the outbox is empty.')
+        parser.add_argument('--once', action='store_true', help='Exit once the outbox has no due invitations.')
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        previous_handlers = {
+            signum: signal.signal(signum, lambda signum, frame: stop.set())
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                futures = [executor.submit(self.work, options, stop) for _ in range(options['workers'])]
+                results = [future.result() for future in futures]
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        sent = sum(result[0] for result in results)
+        failed = sum(result[1] for result in results)
+        self.stdout.write(self.style.SUCCESS(f'Sent {sent} invitation(s), {failed} failed attempt(s).'))
+
+    def work(self, options, stop):
+        sent = failed = 0
+        mail_connection = get_connection()
+        try:
+            while not stop.is_set():
+                invitations = claim_invitations(options['batch_size'])
+                if not invitations:
+                    if options['once']:
+                        break
+                    mail_connection.close()
+                    stop.wait(options['poll_interval'])
+                    continue
+
+                try:
+                    mail_connection.open()
+                except (OSError, smtplib.SMTPException):
+                    pass
+                batch_sent, batch_failed = deliver_invitations(invitations, mail_connection)
+                sent += len(batch_sent)
+                failed += len(batch_failed)
+        finally:
+            mail_connection.close()
+            connections.close_all()
+        return sent, failed
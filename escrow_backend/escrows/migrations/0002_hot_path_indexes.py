@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:49
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('escrows', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='escrowparticipant',
+            index=models.Index(fields=['user', 'transaction'], name='escrow_part_user_tx_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='escrowparticipant',
+            index=models.Index(fields=['email', 'transaction'], name='escrow_part_email_tx_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='escrowparticipant',
+            index=models.Index(condition=models.Q(('has_accepted', False)), fields=['transaction'], name='escrow_part_pending_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='escrowtransaction',
+            index=models.Index(fields=['-created_at', '-id'], name='escrow_tx_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='escrowtransaction',
+            index=models.Index(fields=['created_by', '-created_at'], name='escrow_tx_creator_created_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:52
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_participant_counters(apps, schema_editor):
+    EscrowTransaction = apps.get_model('escrows', 'EscrowTransaction')
+    EscrowParticipant = apps.get_model('escrows', 'EscrowParticipant')
+    participants = EscrowParticipant.objects.filter(transaction=models.OuterRef('pk')).order_by().values('transaction')
+
+    def count(**filters):
+        counted = participants.filter(**filters).annotate(total=models.Count('pk')).values('total')
+        return Coalesce(models.Subquery(counted), 0)
+
+    EscrowTransaction.objects.update(
+        participant_count=count(),
+        accepted_count=count(has_accepted=True),
+        buyer_count=count(role='BUYER'),
+        seller_count=count(role='SELLER'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('escrows', '0002_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='escrowtransaction',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='escrowtransaction',
+            name='buyer_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='escrowtransaction',
+            name='participant_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='escrowtransaction',
+            name='seller_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_participant_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('escrows', '0004_idempotency_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EscrowEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('DRAFT', 'Draft'), ('INVITING', 'Inviting'), ('PENDING_ACCEPTANCE', 'Pending acceptance'), ('ACTIVE', 'Active'), ('CANCELLED', 'Cancelled'), ('COMPLETED', 'Completed')], max_length=30)),
+                ('to_status', models.CharField(choices=[('DRAFT', 'Draft'), ('INVITING', 'Inviting'), ('PENDING_ACCEPTANCE', 'Pending acceptance'), ('ACTIVE', 'Active'), ('CANCELLED', 'Cancelled'), ('COMPLETED', 'Completed')], max_length=30)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='escrow_events', to=settings.AUTH_USER_MODEL)),
+                ('transaction', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='escrows.escrowtransaction')),
+            ],
+            options={
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['created_at', 'id'], name='escrow_event_created_idx'), models.Index(fields=['transaction', 'created_at'], name='escrow_event_tx_created_idx')],
+            },
+        ),
+    ]
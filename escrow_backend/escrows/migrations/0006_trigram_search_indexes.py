@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('escrows', '0005_escrow_event'),
+        ('accounts', '0003_trigram_search_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='escrowparticipant',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='escrow_part_email_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='escrowtransaction',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('agreement_name'), name='gin_trgm_ops'), name='escrow_tx_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='escrowtransaction',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('property_address'), name='gin_trgm_ops'), name='escrow_tx_address_trgm_idx'),
+        ),
+    ]
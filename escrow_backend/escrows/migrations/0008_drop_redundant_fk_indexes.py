@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+REDUNDANT_INDEXES = [
+    ('escrows_escrowparticipant_transaction_id_e33e7c9d', 'escrows_escrowparticipant', 'transaction_id'),
+    ('escrows_escrowparticipant_user_id_4ecfb3ff', 'escrows_escrowparticipant', 'user_id'),
+    ('escrows_escrowtransaction_created_by_id_99c049f4', 'escrows_escrowtransaction', 'created_by_id'),
+]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('escrows', '0007_invitation_outbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"',
+                    reverse_sql=f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}" ("{column}")',
+                )
+                for name, table, column in REDUNDANT_INDEXES
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='escrowparticipant',
+                    name='transaction',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='participants', to='escrows.escrowtransaction'),
+                ),
+                migrations.AlterField(
+                    model_name='escrowparticipant',
+                    name='user',
+                    field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='escrow_participations', to=settings.AUTH_USER_MODEL),
+                ),
+                migrations.AlterField(
+                    model_name='escrowtransaction',
+                    name='created_by',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='created_escrow_transactions', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+    ]
@@ -1,7 +1,12 @@
 from decimal import Decimal
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Upper
+from django.utils import timezone
 
 
 class Currency(models.TextChoices):
@@ -44,6 +49,7 @@ class EscrowTransaction(models.Model):
         'accounts.User',
         on_delete=models.CASCADE,
         related_name='created_escrow_transactions',
+        db_index=False,
     )
     agreement_name = models.CharField(max_length=200)
     currency = models.CharField(max_length=3, choices=Currency.choices)
@@ -53,11 +59,21 @@ class EscrowTransaction(models.Model):
     estimated_closing_date = models.DateField(null=True, blank=True)
     property_address = models.TextField()
     status = models.CharField(max_length=30, choices=EscrowStatus.choices, default=EscrowStatus.DRAFT)
+    participant_count = models.PositiveIntegerField(default=0, editable=False)
+    accepted_count = models.PositiveIntegerField(default=0, editable=False)
+    buyer_count = models.PositiveIntegerField(default=0, editable=False)
+    seller_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='escrow_tx_created_idx'),
+            models.Index(fields=['created_by', '-created_at'], name='escrow_tx_creator_created_idx'),
+            GinIndex(OpClass(Upper('agreement_name'), name='gin_trgm_ops'), name='escrow_tx_name_trgm_idx'),
+            GinIndex(OpClass(Upper('property_address'), name='gin_trgm_ops'), name='escrow_tx_address_trgm_idx'),
+        ]
 
     def __str__(self):
         return f"{self.agreement_name} ({self.get_status_display()})"
@@ -69,13 +85,10 @@ class EscrowTransaction(models.Model):
             errors['created_by'] = 'Creator must be a broker.'
 
         if self.pk:
-            buyers_exist = self.participants.filter(role=EscrowRole.BUYER).exists()
-            sellers_exist = self.participants.filter(role=EscrowRole.SELLER).exists()
-
             missing_roles = []
-            if not buyers_exist:
+            if not self.buyer_count:
                 missing_roles.append('buyer')
-            if not sellers_exist:
+            if not self.seller_count:
                 missing_roles.append('seller')
 
             if missing_roles:
@@ -90,6 +103,7 @@ class EscrowParticipant(models.Model):
         EscrowTransaction,
         on_delete=models.CASCADE,
         related_name='participants',
+        db_index=False,
     )
     user = models.ForeignKey(
         'accounts.User',
@@ -97,6 +111,7 @@ class EscrowParticipant(models.Model):
         blank=True,
         on_delete=models.SET_NULL,
         related_name='escrow_participations',
+        db_index=False,
     )
     email = models.EmailField()
     role = models.CharField(max_length=20, choices=EscrowRole.choices)
@@ -106,6 +121,16 @@ class EscrowParticipant(models.Model):
 
     class Meta:
         unique_together = ('transaction', 'email', 'role')
+        indexes = [
+            models.Index(fields=['user', 'transaction'], name='escrow_part_user_tx_idx'),
+            models.Index(fields=['email', 'transaction'], name='escrow_part_email_tx_idx'),
+            models.Index(
+                fields=['transaction'],
+                condition=models.Q(has_accepted=False),
+                name='escrow_part_pending_idx',
+            ),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='escrow_part_email_trgm_idx'),
+        ]
 
     def __str__(self):
         return f"{self.email} - {self.get_role_display()}"
@@ -156,3 +181,89 @@ class CommissionSplit(models.Model):
 
         if errors:
             raise ValidationError(errors)
+
+
+class EscrowEvent(models.Model):
+    transaction = models.ForeignKey(
+        EscrowTransaction,
+        on_delete=models.CASCADE,
+        related_name='events',
+    )
+    from_status = models.CharField(max_length=30, choices=EscrowStatus.choices, blank=True)
+    to_status = models.CharField(max_length=30, choices=EscrowStatus.choices)
+    actor = models.ForeignKey(
+        'accounts.User',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='escrow_events',
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='escrow_event_created_idx'),
+            models.Index(fields=['transaction', 'created_at'], name='escrow_event_tx_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.transaction_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class IdempotencyKey(models.Model):
+    user = models.ForeignKey(
+        'accounts.User',
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys',
+    )
+    key = models.CharField(max_length=255)
+    request_fingerprint = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='unique_idempotency_key_per_user'),
+        ]
+
+    def __str__(self):
+        return f"IdempotencyKey(user={self.user_id}, key={self.key})"
+
+    @property
+    def is_expired(self):
+        return self.created_at < timezone.now() - settings.IDEMPOTENCY_KEY_TTL
+
+
+class InvitationStatus(models.TextChoices):
+    PENDING = 'PENDING', 'Pending'
+    SENT = 'SENT', 'Sent'
+    FAILED = 'FAILED', 'Failed'
+
+
+class InvitationOutbox(models.Model):
+    participant = models.OneToOneField(
+        EscrowParticipant,
+        on_delete=models.CASCADE,
+        related_name='invitation',
+    )
+    status = models.CharField(max_length=20, choices=InvitationStatus.choices, default=InvitationStatus.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at', 'id'],
+                condition=models.Q(status='PENDING'),
+                name='invitation_outbox_due_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"InvitationOutbox(participant={self.participant_id}, status={self.status})"
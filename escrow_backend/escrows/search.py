@@ -0,0 +1,21 @@
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import models
+from django.db.models.functions import Greatest, Upper
+
+SEARCH_FIELDS = ('agreement_name', 'property_address', 'created_by__email')
+
+
+def search_escrows(queryset, query):
+    term = query.upper()
+    aliases = {f'search_{field}': Upper(field) for field in SEARCH_FIELDS}
+
+    matches = models.Q()
+    for alias in aliases:
+        matches |= models.Q(**{f'{alias}__trigram_word_similar': term})
+
+    return (
+        queryset.alias(**aliases)
+        .filter(matches)
+        .annotate(rank=Greatest(*[TrigramWordSimilarity(term, alias) for alias in aliases]))
+        .order_by('-rank', '-created_at', '-id')
+    )
@@ -3,8 +3,12 @@ from decimal import Decimal
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from accounts.cache import is_broker
+
+from .exports import CSV, NDJSON
 from .models import (
     CommissionSplit,
+    Currency,
     EscrowParticipant,
     EscrowRole,
     EscrowStatus,
@@ -52,11 +56,31 @@ class EscrowTransactionSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         request = self.context.get('request')
-        if request and not getattr(request.user, 'is_broker', False):
+        if request and not is_broker(request.user):
             raise serializers.ValidationError('Only brokers can create escrow transactions.')
         return super().validate(attrs)
 
 
+class EscrowTransactionListSerializer(EscrowTransactionSerializer):
+    role = serializers.CharField(read_only=True)
+
+    class Meta(EscrowTransactionSerializer.Meta):
+        fields = EscrowTransactionSerializer.Meta.fields + ['role']
+        read_only_fields = EscrowTransactionSerializer.Meta.read_only_fields + ['role']
+
+
+class EscrowSearchResultSerializer(EscrowTransactionListSerializer):
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(EscrowTransactionListSerializer.Meta):
+        fields = EscrowTransactionListSerializer.Meta.fields + ['rank']
+        read_only_fields = EscrowTransactionListSerializer.Meta.read_only_fields + ['rank']
+
+
+class EscrowSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=3, max_length=255)
+
+
 class EscrowInviteSerializer(serializers.Serializer):
     cobroker_email = serializers.EmailField(required=False, allow_null=True)
     buyer_email = serializers.EmailField(required=True)
@@ -87,5 +111,32 @@ class EscrowInviteSerializer(serializers.Serializer):
 
 
 class EscrowAcceptSerializer(serializers.Serializer):
-    email = serializers.EmailField(required=False)
     token = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+class EscrowBatchSerializer(serializers.Serializer):
+    MODE_ATOMIC = 'atomic'
+    MODE_PARTIAL = 'partial'
+    MAX_ITEMS = 500
+
+    mode = serializers.ChoiceField(choices=[MODE_ATOMIC, MODE_PARTIAL], default=MODE_ATOMIC)
+    items = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_ITEMS,
+    )
+
+
+class EscrowExportSerializer(serializers.Serializer):
+    file_format = serializers.ChoiceField(choices=[CSV, NDJSON], default=CSV)
+    status = serializers.ChoiceField(choices=EscrowStatus.choices, required=False)
+    currency = serializers.ChoiceField(choices=Currency.choices, required=False)
+    created_after = serializers.DateField(required=False)
+    created_before = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        created_after = attrs.get('created_after')
+        created_before = attrs.get('created_before')
+        if created_after and created_before and created_after > created_before:
+            raise serializers.ValidationError('created_after must not be later than created_before.')
+        return attrs
@@ -0,0 +1,166 @@
+from django.db import models
+from django.db import transaction as db_transaction
+from django.db.models.functions import Coalesce
+
+from accounts.models import User
+
+from .invitations import enqueue_invitations
+from .models import CommissionSplit, EscrowParticipant, EscrowRole, EscrowStatus, EscrowTransaction
+from .state import check_transition, record_created, transition
+
+PARTICIPANT_UNIQUE_FIELDS = ['transaction', 'email', 'role']
+
+ROLE_PRECEDENCE = models.Case(
+    models.When(role=EscrowRole.BROKER, then=models.Value(0)),
+    models.When(role=EscrowRole.CO_BROKER, then=models.Value(1)),
+    models.When(role=EscrowRole.BUYER, then=models.Value(2)),
+    models.When(role=EscrowRole.SELLER, then=models.Value(3)),
+    default=models.Value(4),
+)
+
+
+def participant_escrows(user):
+    own_participations = EscrowParticipant.objects.filter(
+        models.Q(user=user) | models.Q(email=user.email),
+        transaction=models.OuterRef('pk'),
+    )
+    participant_role = own_participations.order_by(ROLE_PRECEDENCE).values('role')[:1]
+
+    return (
+        EscrowTransaction.objects.filter(
+            models.Q(created_by=user) | models.Exists(own_participations)
+        )
+        .annotate(
+            role=Coalesce(
+                models.Subquery(participant_role),
+                models.Value(EscrowRole.BROKER),
+            )
+        )
+        .prefetch_related('participants')
+    )
+
+
+def participant_counter_values():
+    participants = EscrowParticipant.objects.filter(transaction=models.OuterRef('pk')).order_by().values('transaction')
+
+    def count(**filters):
+        counted = participants.filter(**filters).annotate(total=models.Count('pk')).values('total')
+        return Coalesce(models.Subquery(counted), 0)
+
+    return {
+        'participant_count': count(),
+        'accepted_count': count(has_accepted=True),
+        'buyer_count': count(role=EscrowRole.BUYER),
+        'seller_count': count(role=EscrowRole.SELLER),
+    }
+
+
+def participant_counter_drift():
+    drift = models.Q()
+    for field, expression in participant_counter_values().items():
+        drift |= ~models.Q(**{field: expression})
+    return drift
+
+
+def refresh_participant_counters(queryset):
+    return queryset.update(**participant_counter_values())
+
+
+def set_participant_counters(escrow, participants):
+    escrow.participant_count = len(participants)
+    escrow.accepted_count = sum(1 for participant in participants if participant.has_accepted)
+    escrow.buyer_count = sum(1 for participant in participants if participant.role == EscrowRole.BUYER)
+    escrow.seller_count = sum(1 for participant in participants if participant.role == EscrowRole.SELLER)
+
+
+def upsert_participants(participants):
+    return EscrowParticipant.objects.bulk_create(
+        participants,
+        update_conflicts=True,
+        unique_fields=PARTICIPANT_UNIQUE_FIELDS,
+        update_fields=['updated_at'],
+    )
+
+
+def ensure_broker_participant(escrow, broker):
+    EscrowParticipant.objects.bulk_create(
+        [EscrowParticipant(transaction=escrow, user=broker, email=broker.email, role=EscrowRole.BROKER)],
+        ignore_conflicts=True,
+    )
+
+
+def build_invite_participants(escrow, broker, data):
+    participants = [
+        EscrowParticipant(transaction=escrow, user=broker, email=broker.email, role=EscrowRole.BROKER),
+    ]
+    if data.get('cobroker_email'):
+        participants.append(
+            EscrowParticipant(transaction=escrow, email=data['cobroker_email'], role=EscrowRole.CO_BROKER)
+        )
+    participants.append(EscrowParticipant(transaction=escrow, email=data['buyer_email'], role=EscrowRole.BUYER))
+    if data.get('seller_email'):
+        participants.append(
+            EscrowParticipant(transaction=escrow, email=data['seller_email'], role=EscrowRole.SELLER)
+        )
+    return participants
+
+
+def build_commission_split(escrow, broker, co_broker, data):
+    return CommissionSplit(
+        transaction=escrow,
+        broker=broker,
+        co_broker=co_broker,
+        broker_share_pct=data['broker_share_pct'],
+        co_broker_share_pct=data['co_broker_share_pct'],
+    )
+
+
+def invite_participants(escrow, broker, data):
+    cobroker_email = data.get('cobroker_email')
+
+    check_transition(escrow, EscrowStatus.PENDING_ACCEPTANCE)
+
+    with db_transaction.atomic(savepoint=False):
+        enqueue_invitations(upsert_participants(build_invite_participants(escrow, broker, data)))
+
+        co_broker = User.objects.filter(email=cobroker_email).first() if cobroker_email else None
+        CommissionSplit.objects.bulk_create(
+            [build_commission_split(escrow, broker, co_broker, data)],
+            update_conflicts=True,
+            unique_fields=['transaction'],
+            update_fields=['broker', 'co_broker', 'broker_share_pct', 'co_broker_share_pct', 'updated_at'],
+        )
+
+        transition(escrow, EscrowStatus.PENDING_ACCEPTANCE, actor=broker, **participant_counter_values())
+
+    return escrow
+
+
+def create_escrows_with_invites(broker, entries):
+    cobroker_emails = {invite['cobroker_email'] for _, invite in entries if invite.get('cobroker_email')}
+
+    with db_transaction.atomic(savepoint=False):
+        co_brokers = {}
+        if cobroker_emails:
+            co_brokers = {user.email: user for user in User.objects.filter(email__in=cobroker_emails)}
+
+        escrows = []
+        participants = []
+        splits = []
+        for transaction_data, invite in entries:
+            escrow = EscrowTransaction(created_by=broker, status=EscrowStatus.PENDING_ACCEPTANCE, **transaction_data)
+            escrow_participants = build_invite_participants(escrow, broker, invite)
+            set_participant_counters(escrow, escrow_participants)
+            co_broker = co_brokers.get(invite.get('cobroker_email'))
+
+            escrows.append(escrow)
+            participants.extend(escrow_participants)
+            splits.append(build_commission_split(escrow, broker, co_broker, invite))
+
+        EscrowTransaction.objects.bulk_create(escrows)
+        EscrowParticipant.objects.bulk_create(participants)
+        enqueue_invitations(participants)
+        CommissionSplit.objects.bulk_create(splits)
+        record_created(escrows, broker)
+
+    return escrows
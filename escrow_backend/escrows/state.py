@@ -0,0 +1,66 @@
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .models import EscrowEvent, EscrowStatus, EscrowTransaction
+
+
+class IllegalTransition(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'This escrow cannot move to the requested status.'
+    default_code = 'illegal_transition'
+
+
+def all_participants_accepted(escrow):
+    return escrow.participant_count > 0 and escrow.accepted_count >= escrow.participant_count
+
+
+TRANSITIONS = {
+    (EscrowStatus.INVITING, EscrowStatus.PENDING_ACCEPTANCE): None,
+    (EscrowStatus.PENDING_ACCEPTANCE, EscrowStatus.PENDING_ACCEPTANCE): None,
+    (EscrowStatus.PENDING_ACCEPTANCE, EscrowStatus.ACTIVE): all_participants_accepted,
+    (EscrowStatus.ACTIVE, EscrowStatus.COMPLETED): None,
+    (EscrowStatus.DRAFT, EscrowStatus.CANCELLED): None,
+    (EscrowStatus.INVITING, EscrowStatus.CANCELLED): None,
+    (EscrowStatus.PENDING_ACCEPTANCE, EscrowStatus.CANCELLED): None,
+    (EscrowStatus.ACTIVE, EscrowStatus.CANCELLED): None,
+}
+
+
+def can_transition(escrow, target):
+    key = (escrow.status, target)
+    if key not in TRANSITIONS:
+        return False
+    guard = TRANSITIONS[key]
+    return guard is None or guard(escrow)
+
+
+def check_transition(escrow, target):
+    if not can_transition(escrow, target):
+        raise IllegalTransition(f'Cannot move escrow from {escrow.status} to {target}.')
+
+
+def transition(escrow, target, actor=None, **updates):
+    check_transition(escrow, target)
+    source = escrow.status
+    now = timezone.now()
+
+    updated = EscrowTransaction.objects.filter(pk=escrow.pk, status=source).update(
+        status=target,
+        updated_at=now,
+        **updates,
+    )
+    if not updated:
+        raise IllegalTransition(f'Escrow is no longer {source}.')
+
+    EscrowEvent.objects.create(transaction=escrow, from_status=source, to_status=target, actor=actor)
+    escrow.status = target
+    escrow.updated_at = now
+    return escrow
+
+
+def record_created(escrows, actor):
+    EscrowEvent.objects.bulk_create([
+        EscrowEvent(transaction=escrow, to_status=escrow.status, actor=actor)
+        for escrow in escrows
+    ])
@@ -0,0 +1,483 @@
+import os
+import signal
+import threading
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db import transaction as db_transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import User
+from escrow_backend.query_budget import assert_max_queries
+from escrow_backend.testing import (
+    QueryBudgetAssertionsMixin,
+    QueryPlanAssertionsMixin,
+    authenticated_client,
+    run_concurrently,
+)
+
+from .invitations import (
+    build_invitation_message,
+    claim_invitations,
+    deliver_invitations,
+    enqueue_invitations,
+    make_invitation_token,
+    retry_delay,
+)
+from .models import (
+    EscrowEvent,
+    EscrowParticipant,
+    EscrowRole,
+    EscrowStatus,
+    EscrowTransaction,
+    IdempotencyKey,
+    InvitationOutbox,
+    InvitationStatus,
+)
+from .serializers import EscrowInviteSerializer
+from .services import (
+    build_invite_participants,
+    create_escrows_with_invites,
+    participant_escrows,
+    upsert_participants,
+)
+
+ESCROW_PAYLOAD = {
+    'agreement_name': 'Agreement',
+    'currency': 'USD',
+    'transaction_type': 'PROPERTY_SALE',
+    'property_type': 'HOUSE',
+    'property_address': '1 Main St',
+}
+
+
+def create_escrow(broker, **fields):
+    return EscrowTransaction.objects.create(
+        created_by=broker,
+        agreement_name=fields.pop('agreement_name', 'Agreement'),
+        currency='USD',
+        transaction_type='PROPERTY_SALE',
+        property_type='HOUSE',
+        property_address=fields.pop('property_address', '1 Main St'),
+        **fields,
+    )
+
+
+class QueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.broker = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+        cls.buyer = User.objects.create_user('buyer@example.com', 'password123')
+        cls.escrow = create_escrow(cls.broker)
+        EscrowParticipant.objects.create(
+            transaction=cls.escrow, user=cls.broker, email=cls.broker.email, role=EscrowRole.BROKER,
+        )
+        cls.participant = EscrowParticipant.objects.create(
+            transaction=cls.escrow, email=cls.buyer.email, role=EscrowRole.BUYER,
+        )
+
+    def test_participant_list_uses_keyset_index(self):
+        queryset = participant_escrows(self.buyer).order_by('-created_at', '-id')[:26]
+        self.assertUsesIndex(queryset, 'escrow_tx_created_idx', enable_sort='off')
+
+    def test_broker_list_uses_creator_index(self):
+        queryset = EscrowTransaction.objects.filter(created_by=self.broker).order_by('-created_at')[:26]
+        self.assertUsesIndex(queryset, 'escrow_tx_creator_created_idx', enable_sort='off')
+
+    def test_participations_by_user_use_user_index(self):
+        queryset = EscrowParticipant.objects.filter(user=self.broker)
+        self.assertUsesIndex(queryset, 'escrow_part_user_tx_idx')
+
+    def test_accept_lookup_by_email_uses_index(self):
+        queryset = self.escrow.participants.filter(email=self.buyer.email).order_by('pk')[:1]
+        self.assertNoSeqScan(queryset)
+
+    def test_accept_lookup_by_token_uses_primary_key(self):
+        queryset = self.escrow.participants.filter(pk=self.participant.pk)
+        self.assertUsesIndex(queryset, 'escrows_escrowparticipant_pkey')
+
+    def test_pending_participants_use_partial_index(self):
+        queryset = EscrowParticipant.objects.filter(transaction=self.escrow, has_accepted=False)
+        self.assertUsesIndex(queryset, 'escrow_part_pending_idx')
+
+
+class QueryBudgetTests(QueryBudgetAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.broker = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+        cls.buyer = User.objects.create_user('buyer@example.com', 'password123')
+        cls.seller = User.objects.create_user('seller@example.com', 'password123')
+        invite = EscrowInviteSerializer(data={'buyer_email': cls.buyer.email, 'seller_email': cls.seller.email})
+        invite.is_valid(raise_exception=True)
+        [cls.escrow] = create_escrows_with_invites(cls.broker, [(dict(ESCROW_PAYLOAD), invite.validated_data)])
+
+    def test_create(self):
+        response = authenticated_client(self.broker).post(
+            '/api/escrows/', ESCROW_PAYLOAD, format='json', HTTP_IDEMPOTENCY_KEY='create',
+        )
+        self.assertWithinQueryBudget(response, 201)
+
+    def test_invite(self):
+        escrow = create_escrow(self.broker, status=EscrowStatus.INVITING)
+        response = authenticated_client(self.broker).post(
+            f'/api/escrows/{escrow.pk}/invite/',
+            {'buyer_email': self.buyer.email, 'seller_email': self.seller.email},
+            format='json',
+            HTTP_IDEMPOTENCY_KEY='invite',
+        )
+        self.assertWithinQueryBudget(response)
+
+    def test_batch(self):
+        items = [
+            {**ESCROW_PAYLOAD, 'invite': {'buyer_email': self.buyer.email, 'seller_email': self.seller.email}}
+            for _ in range(10)
+        ]
+        response = authenticated_client(self.broker).post(
+            '/api/escrows/batch/', {'items': items}, format='json', HTTP_IDEMPOTENCY_KEY='batch',
+        )
+        self.assertWithinQueryBudget(response, 201)
+
+    def test_bulk_create_does_not_scale_with_entries(self):
+        invite = EscrowInviteSerializer(data={
+            'buyer_email': self.buyer.email,
+            'seller_email': self.seller.email,
+            'cobroker_email': 'cobroker@example.com',
+            'broker_share_pct': '60.00',
+            'co_broker_share_pct': '40.00',
+        })
+        invite.is_valid(raise_exception=True)
+
+        with assert_max_queries(6, 'create_escrows_with_invites'):
+            create_escrows_with_invites(self.broker, [(dict(ESCROW_PAYLOAD), invite.validated_data)] * 50)
+
+    def test_search(self):
+        response = authenticated_client(self.buyer).get('/api/escrows/search/', {'q': 'Agreement'})
+        self.assertWithinQueryBudget(response)
+
+    def test_accept_activating_escrow(self):
+        self.escrow.participants.exclude(email=self.buyer.email).update(has_accepted=True)
+        EscrowTransaction.objects.filter(pk=self.escrow.pk).update(accepted_count=2)
+
+        response = authenticated_client(self.buyer).post(f'/api/escrows/{self.escrow.pk}/accept/', {}, format='json')
+
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(response.data['status'], EscrowStatus.ACTIVE)
+
+    def test_accept_by_linked_participant_activating_escrow(self):
+        self.escrow.participants.exclude(role=EscrowRole.BROKER).update(has_accepted=True)
+        EscrowTransaction.objects.filter(pk=self.escrow.pk).update(accepted_count=2)
+
+        response = authenticated_client(self.broker).post(f'/api/escrows/{self.escrow.pk}/accept/', {}, format='json')
+
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(response.data['status'], EscrowStatus.ACTIVE)
+
+    def test_list(self):
+        self.assertWithinQueryBudget(authenticated_client(self.buyer).get('/api/escrows/'))
+
+    def test_detail(self):
+        self.assertWithinQueryBudget(authenticated_client(self.buyer).get(f'/api/escrows/{self.escrow.pk}/'))
+
+
+class ConcurrencyTests(TransactionTestCase):
+    def setUp(self):
+        self.broker = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+        self.buyer = User.objects.create_user('buyer@example.com', 'password123')
+        self.seller = User.objects.create_user('seller@example.com', 'password123')
+
+    def test_parallel_accepts_activate_escrow_once(self):
+        invite = EscrowInviteSerializer(data={'buyer_email': self.buyer.email, 'seller_email': self.seller.email})
+        invite.is_valid(raise_exception=True)
+        [escrow] = create_escrows_with_invites(self.broker, [(dict(ESCROW_PAYLOAD), invite.validated_data)])
+        users = [self.broker, self.buyer, self.seller]
+
+        responses = run_concurrently(
+            lambda index: authenticated_client(users[index]).post(f'/api/escrows/{escrow.pk}/accept/', {}, format='json'),
+            len(users),
+        )
+
+        self.assertEqual([response.status_code for response in responses], [200] * len(users))
+        escrow.refresh_from_db()
+        self.assertEqual(escrow.status, EscrowStatus.ACTIVE)
+        self.assertEqual(escrow.accepted_count, 3)
+        self.assertEqual(EscrowEvent.objects.filter(transaction=escrow, to_status=EscrowStatus.ACTIVE).count(), 1)
+
+    def test_parallel_requests_with_same_idempotency_key_create_one_escrow(self):
+        responses = run_concurrently(
+            lambda index: authenticated_client(self.broker).post(
+                '/api/escrows/', ESCROW_PAYLOAD, format='json', HTTP_IDEMPOTENCY_KEY='create-once',
+            ),
+            8,
+        )
+
+        self.assertEqual([response.status_code for response in responses], [201] * 8)
+        self.assertEqual(len({response.data['id'] for response in responses}), 1)
+        self.assertEqual(EscrowTransaction.objects.count(), 1)
+        self.assertEqual(sum(response.get('Idempotent-Replayed') == 'true' for response in responses), 7)
+
+
+class InvitationTokenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.broker = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+        cls.invitee = User.objects.create_user('invitee@example.com', 'password123')
+        cls.other = User.objects.create_user('other@example.com', 'password123')
+        cls.escrow = create_escrow(cls.broker)
+        cls.participant = EscrowParticipant.objects.create(
+            transaction=cls.escrow, email='invited@example.com', role=EscrowRole.BUYER,
+        )
+
+    def accept(self, user, token):
+        return authenticated_client(user).post(f'/api/escrows/{self.escrow.pk}/accept/', {'token': token}, format='json')
+
+    def test_reinviting_keeps_existing_acceptances(self):
+        self.accept(self.invitee, make_invitation_token(self.participant))
+        EscrowTransaction.objects.filter(pk=self.escrow.pk).update(status=EscrowStatus.PENDING_ACCEPTANCE)
+
+        response = authenticated_client(self.broker).post(
+            f'/api/escrows/{self.escrow.pk}/invite/',
+            {'buyer_email': self.participant.email, 'seller_email': 'seller@example.com'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.participant.refresh_from_db()
+        self.assertTrue(self.participant.has_accepted)
+        self.escrow.refresh_from_db()
+        self.assertEqual(self.escrow.accepted_count, 1)
+
+    @override_settings(FRONTEND_URL='https://app.example.com', INVITATION_TOKEN_MAX_AGE=timedelta(days=7))
+    def test_emailed_link_accepts_invitation(self):
+        message = build_invitation_message(InvitationOutbox(participant=self.participant), connection=None)
+        prefix = f'https://app.example.com/escrows/{self.escrow.pk}/accept?token='
+        token = message.body.split(prefix, 1)[1].split()[0]
+
+        self.assertIn('This link expires in 1\xa0week.', message.body)
+        self.assertEqual(self.accept(self.invitee, token).status_code, 200)
+
+    def test_reusing_token_is_idempotent(self):
+        token = make_invitation_token(self.participant)
+
+        first = self.accept(self.invitee, token)
+        second = self.accept(self.invitee, token)
+
+        self.assertEqual([first.status_code, second.status_code], [200, 200])
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.user, self.invitee)
+        self.escrow.refresh_from_db()
+        self.assertEqual(self.escrow.accepted_count, 1)
+
+    def test_token_claimed_by_another_user_is_forbidden(self):
+        token = make_invitation_token(self.participant)
+        self.accept(self.invitee, token)
+
+        response = self.accept(self.other, token)
+
+        self.assertEqual(response.status_code, 403)
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.user, self.invitee)
+
+    def test_tampered_token_is_rejected(self):
+        token = make_invitation_token(self.participant)
+        tampered = token[:-1] + ('A' if token[-1] != 'A' else 'B')
+
+        response = self.accept(self.invitee, tampered)
+
+        self.assertEqual(response.status_code, 400)
+        self.participant.refresh_from_db()
+        self.assertIsNone(self.participant.user)
+
+    def test_expired_token_is_rejected(self):
+        token = make_invitation_token(self.participant)
+
+        with override_settings(INVITATION_TOKEN_MAX_AGE=timedelta(seconds=-1)):
+            response = self.accept(self.invitee, token)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['detail'], 'Invitation token has expired.')
+        self.participant.refresh_from_db()
+        self.assertIsNone(self.participant.user)
+
+
+class FailingMailConnection:
+    def send_messages(self, messages):
+        raise OSError('Connection refused')
+
+
+def create_invited_escrow():
+    broker = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+    invite = EscrowInviteSerializer(data={'buyer_email': 'buyer@example.com', 'seller_email': 'seller@example.com'})
+    invite.is_valid(raise_exception=True)
+    [escrow] = create_escrows_with_invites(broker, [(dict(ESCROW_PAYLOAD), invite.validated_data)])
+    return escrow, invite.validated_data
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', INVITATION_MAX_ATTEMPTS=3)
+class InvitationOutboxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.escrow, cls.invite = create_invited_escrow()
+
+    def test_reinviting_does_not_enqueue_duplicates(self):
+        participants = build_invite_participants(self.escrow, self.escrow.created_by, self.invite)
+        enqueue_invitations(upsert_participants(participants))
+
+        self.assertEqual(
+            sorted(InvitationOutbox.objects.values_list('participant__email', 'participant__role')),
+            [('buyer@example.com', EscrowRole.BUYER), ('seller@example.com', EscrowRole.SELLER)],
+        )
+
+    def test_claim_pushes_claimed_rows_out_of_the_due_window(self):
+        first = claim_invitations(batch_size=1)
+        second = claim_invitations(batch_size=10)
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual(len(second), 1)
+        self.assertNotEqual(first[0].pk, second[0].pk)
+        self.assertEqual(claim_invitations(batch_size=10), [])
+
+    def test_delivery_sends_accept_link(self):
+        invitations = claim_invitations(batch_size=10)
+
+        sent, failed = deliver_invitations(invitations, mail.get_connection())
+
+        self.assertEqual((len(sent), failed), (2, []))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ['buyer@example.com', 'seller@example.com'])
+        self.assertIn(f'/escrows/{self.escrow.pk}/accept?token=', mail.outbox[0].body)
+        self.assertFalse(InvitationOutbox.objects.exclude(status=InvitationStatus.SENT).exists())
+        self.assertFalse(InvitationOutbox.objects.filter(sent_at__isnull=True).exists())
+
+    def test_failures_back_off_until_marked_failed(self):
+        invitation = InvitationOutbox.objects.order_by('pk').first()
+
+        for attempt in range(1, 3):
+            started = timezone.now()
+            deliver_invitations([invitation], FailingMailConnection())
+            invitation.refresh_from_db()
+            self.assertEqual(invitation.status, InvitationStatus.PENDING)
+            self.assertEqual(invitation.attempts, attempt)
+            self.assertGreaterEqual(invitation.next_attempt_at, started + retry_delay(attempt))
+            self.assertEqual(invitation.last_error, 'OSError: Connection refused')
+
+        deliver_invitations([invitation], FailingMailConnection())
+        invitation.refresh_from_db()
+        self.assertEqual(invitation.status, InvitationStatus.FAILED)
+        self.assertEqual(invitation.attempts, 3)
+        self.assertEqual(mail.outbox, [])
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class InvitationWorkerTests(TransactionTestCase):
+    def setUp(self):
+        self.escrow, _ = create_invited_escrow()
+
+    def test_claim_skips_rows_locked_by_another_worker(self):
+        locked = InvitationOutbox.objects.order_by('pk').first()
+        row_locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            try:
+                with db_transaction.atomic():
+                    InvitationOutbox.objects.select_for_update().get(pk=locked.pk)
+                    row_locked.set()
+                    release.wait(10)
+            finally:
+                connections.close_all()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        try:
+            row_locked.wait(10)
+            claimed = claim_invitations(batch_size=10)
+        finally:
+            release.set()
+            holder.join()
+
+        self.assertEqual(len(claimed), 1)
+        self.assertNotEqual(claimed[0].pk, locked.pk)
+
+    def test_once_drains_outbox(self):
+        stdout = StringIO()
+        call_command('send_invitations', '--once', '--workers', '2', stdout=stdout)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn('Sent 2 invitation(s), 0 failed attempt(s).', stdout.getvalue())
+        self.assertFalse(InvitationOutbox.objects.filter(status=InvitationStatus.PENDING).exists())
+
+    def test_sigint_stops_polling_workers(self):
+        previous_handler = signal.getsignal(signal.SIGINT)
+        timer = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGINT))
+        timer.start()
+        try:
+            call_command('send_invitations', '--workers', '2', '--poll-interval', '30', stdout=StringIO())
+        finally:
+            timer.cancel()
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIs(signal.getsignal(signal.SIGINT), previous_handler)
+
+
+class IdempotencyKeyPurgeTests(TestCase):
+    def test_purges_only_expired_keys(self):
+        user = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+        expired = IdempotencyKey.objects.create(user=user, key='old', request_fingerprint='a')
+        fresh = IdempotencyKey.objects.create(user=user, key='new', request_fingerprint='b')
+        IdempotencyKey.objects.filter(pk=expired.pk).update(created_at=timezone.now() - timedelta(days=2))
+
+        call_command('purge_idempotency_keys', '--batch-size', '1', stdout=StringIO())
+
+        self.assertEqual(list(IdempotencyKey.objects.values_list('pk', flat=True)), [fresh.pk])
+
+
+class EscrowAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin@example.com', 'password123')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def create_escrows(self, count):
+        start = EscrowTransaction.objects.count()
+        brokers = User.objects.bulk_create(
+            User(email=f'broker{index}@example.com', is_broker=True) for index in range(start, start + count)
+        )
+        EscrowTransaction.objects.bulk_create(
+            EscrowTransaction(created_by=broker, **{**ESCROW_PAYLOAD, 'agreement_name': f'Agreement {index}'})
+            for index, broker in enumerate(brokers, start=start)
+        )
+
+    def test_escrow_changelist_query_count_does_not_grow_with_rows(self):
+        self.create_escrows(5)
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self.client.get('/admin/escrows/escrowtransaction/').status_code, 200)
+
+        self.create_escrows(45)
+        with self.assertNumQueries(len(small.captured_queries)):
+            response = self.client.get('/admin/escrows/escrowtransaction/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Agreement 49')
+
+    def test_event_log_is_read_only(self):
+        escrow = create_escrow(self.admin)
+        event = EscrowEvent.objects.create(transaction=escrow, to_status=EscrowStatus.DRAFT, actor=self.admin)
+
+        self.assertEqual(self.client.get('/admin/escrows/escrowevent/add/').status_code, 403)
+        self.assertEqual(self.client.get(f'/admin/escrows/escrowevent/{event.pk}/change/').status_code, 200)
+        self.assertEqual(
+            self.client.post(f'/admin/escrows/escrowevent/{event.pk}/change/', {'to_status': 'ACTIVE'}).status_code,
+            403,
+        )
+        self.assertEqual(self.client.post(f'/admin/escrows/escrowevent/{event.pk}/delete/', {'post': 'yes'}).status_code, 403)
+        event.refresh_from_db()
+        self.assertEqual(event.to_status, EscrowStatus.DRAFT)
+
+    def test_outbox_rows_cannot_be_added_by_hand(self):
+        self.assertEqual(self.client.get('/admin/escrows/invitationoutbox/add/').status_code, 403)
@@ -1,8 +1,13 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from .async_views import AsyncEscrowDetailView, AsyncEscrowListView
 from .views import EscrowTransactionViewSet
 
 router = DefaultRouter()
 router.register('escrows', EscrowTransactionViewSet, basename='escrowtransaction')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path('escrows/', AsyncEscrowListView.as_view(), name='escrowtransaction-list'),
+    path('escrows/<int:pk>/', AsyncEscrowDetailView.as_view(), name='escrowtransaction-detail'),
+] + router.urls
@@ -1,23 +1,46 @@
 from django.db import models
+from django.db import transaction as db_transaction
+from django.http import StreamingHttpResponse
 from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from accounts.models import User
-
-from .models import CommissionSplit, EscrowParticipant, EscrowRole, EscrowStatus, EscrowTransaction
-from .serializers import EscrowAcceptSerializer, EscrowInviteSerializer, EscrowTransactionSerializer
-
+from accounts.cache import is_broker
+from escrow_backend.db_router import replica_reads
+from escrow_backend.pagination import SearchPagination
+from escrow_backend.query_budget import query_budget
+
+from .exports import CONTENT_TYPES, export_queryset, iter_export
+from .idempotency import idempotent
+from .invitations import InvalidInvitationToken, verify_invitation_token
+from .models import EscrowStatus, EscrowTransaction
+from .serializers import (
+    EscrowAcceptSerializer,
+    EscrowBatchSerializer,
+    EscrowExportSerializer,
+    EscrowInviteSerializer,
+    EscrowSearchResultSerializer,
+    EscrowSearchSerializer,
+    EscrowTransactionSerializer,
+)
+from .search import search_escrows
+from .services import (
+    create_escrows_with_invites,
+    ensure_broker_participant,
+    invite_participants,
+    participant_escrows,
+)
+from .state import can_transition, record_created, transition
 
 class IsBroker(permissions.BasePermission):
     def has_permission(self, request, view):
-        if view.action in ['create', 'invite']:
-            return bool(request.user and request.user.is_authenticated and request.user.is_broker)
+        if view.action in ['create', 'invite', 'batch']:
+            return is_broker(request.user)
         return True
 
     def has_object_permission(self, request, view, obj):
         if view.action in ['invite']:
-            return obj.created_by_id == request.user.id and request.user.is_broker
+            return obj.created_by_id == request.user.id and is_broker(request.user)
         return True
 
 
@@ -26,95 +49,140 @@ class EscrowTransactionViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet)
     serializer_class = EscrowTransactionSerializer
     permission_classes = [permissions.IsAuthenticated & IsBroker]
 
-    def perform_create(self, serializer):
-        serializer.save()
-        EscrowParticipant.objects.get_or_create(
-            transaction=serializer.instance,
-            email=self.request.user.email,
-            role=EscrowRole.BROKER,
-            defaults={'user': self.request.user},
-        )
+    locking_actions = ('invite', 'accept')
 
-    @action(detail=True, methods=['post'], url_path='invite', permission_classes=[permissions.IsAuthenticated, IsBroker])
-    def invite(self, request, pk=None):
-        transaction = self.get_object()
-        serializer = EscrowInviteSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        data = serializer.validated_data
+    def get_queryset(self):
+        if self.action in self.locking_actions:
+            return super().get_queryset().select_for_update()
+        return super().get_queryset()
 
-        EscrowParticipant.objects.get_or_create(
-            transaction=transaction,
-            email=request.user.email,
-            role=EscrowRole.BROKER,
-            defaults={'user': request.user},
-        )
+    @query_budget(7)
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
 
-        if data.get('cobroker_email'):
-            EscrowParticipant.objects.update_or_create(
-                transaction=transaction,
-                email=data['cobroker_email'],
-                role=EscrowRole.CO_BROKER,
-                defaults={'has_accepted': False},
-            )
-
-        EscrowParticipant.objects.update_or_create(
-            transaction=transaction,
-            email=data['buyer_email'],
-            role=EscrowRole.BUYER,
-            defaults={'has_accepted': False},
-        )
-
-        seller_email = data.get('seller_email')
-        if seller_email:
-            EscrowParticipant.objects.update_or_create(
-                transaction=transaction,
-                email=seller_email,
-                role=EscrowRole.SELLER,
-                defaults={'has_accepted': False},
-            )
-
-        co_broker_user = None
-        if data.get('cobroker_email'):
-            co_broker_user = User.objects.filter(email=data['cobroker_email']).first()
-
-        CommissionSplit.objects.update_or_create(
-            transaction=transaction,
-            defaults={
-                'broker': request.user,
-                'co_broker': co_broker_user,
-                'broker_share_pct': data['broker_share_pct'],
-                'co_broker_share_pct': data['co_broker_share_pct'],
-            },
-        )
+    def perform_create(self, serializer):
+        serializer.save(participant_count=1)
+        ensure_broker_participant(serializer.instance, self.request.user)
+        record_created([serializer.instance], self.request.user)
 
-        transaction.status = EscrowStatus.PENDING_ACCEPTANCE
-        transaction.save(update_fields=['status'])
+    @query_budget(10)
+    @action(detail=True, methods=['post'], url_path='invite', permission_classes=[permissions.IsAuthenticated, IsBroker])
+    @idempotent
+    def invite(self, request, pk=None):
+        with db_transaction.atomic(savepoint=False):
+            transaction = self.get_object()
+            serializer = EscrowInviteSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            invite_participants(transaction, request.user, serializer.validated_data)
 
         response_serializer = EscrowTransactionSerializer(transaction, context={'request': request})
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
-    @action(detail=True, methods=['post'], url_path='accept', permission_classes=[permissions.IsAuthenticated])
-    def accept(self, request, pk=None):
-        transaction = self.get_object()
-        serializer = EscrowAcceptSerializer(data=request.data)
+    @query_budget(8)
+    @action(detail=False, methods=['post'], url_path='batch', permission_classes=[permissions.IsAuthenticated, IsBroker])
+    @idempotent
+    def batch(self, request):
+        serializer = EscrowBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        mode = serializer.validated_data['mode']
+
+        results = []
+        entries = []
+        for index, item in enumerate(serializer.validated_data['items']):
+            transaction_serializer = EscrowTransactionSerializer(data=item, context=self.get_serializer_context())
+            invite_serializer = EscrowInviteSerializer(data=item.get('invite') or {})
+            transaction_valid = transaction_serializer.is_valid()
+            invite_valid = invite_serializer.is_valid()
+
+            if transaction_valid and invite_valid:
+                results.append({'index': index, 'status': 'valid'})
+                entries.append((transaction_serializer.validated_data, invite_serializer.validated_data))
+                continue
+
+            errors = dict(transaction_serializer.errors)
+            if not invite_valid:
+                errors['invite'] = invite_serializer.errors
+            results.append({'index': index, 'status': 'error', 'errors': errors})
+
+        has_errors = len(entries) < len(results)
+        if has_errors and mode == EscrowBatchSerializer.MODE_ATOMIC:
+            return Response({'mode': mode, 'results': results}, status=status.HTTP_400_BAD_REQUEST)
+
+        escrows = iter(create_escrows_with_invites(request.user, entries) if entries else [])
+        for result in results:
+            if result['status'] == 'valid':
+                result.update(status='created', id=next(escrows).pk)
+
+        response_status = status.HTTP_207_MULTI_STATUS if has_errors else status.HTTP_201_CREATED
+        return Response({'mode': mode, 'results': results}, status=response_status)
+
+    @query_budget(4)
+    @action(detail=False, methods=['get'], url_path='search', pagination_class=SearchPagination)
+    def search(self, request):
+        serializer = EscrowSearchSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
-        email = serializer.validated_data.get('email') or request.user.email
 
-        participant = transaction.participants.filter(
-            models.Q(user=request.user) | models.Q(email=email)
-        ).first()
+        with replica_reads(request.user):
+            queryset = search_escrows(participant_escrows(request.user), serializer.validated_data['q'])
+            page = self.paginate_queryset(queryset)
+            data = EscrowSearchResultSerializer(page, many=True, context=self.get_serializer_context()).data
+        return self.get_paginated_response(data)
 
-        if not participant:
-            return Response({'detail': 'Participant not found for this transaction.'}, status=status.HTTP_404_NOT_FOUND)
+    @action(detail=False, methods=['get'], url_path='export', permission_classes=[permissions.IsAdminUser])
+    def export(self, request):
+        serializer = EscrowExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = dict(serializer.validated_data)
+        file_format = filters.pop('file_format')
+
+        with replica_reads(request.user):
+            queryset = export_queryset(**filters)
 
-        participant.user = participant.user or request.user
-        participant.has_accepted = True
-        participant.save(update_fields=['user', 'has_accepted', 'updated_at'])
+        response = StreamingHttpResponse(
+            iter_export(queryset, file_format),
+            content_type=CONTENT_TYPES[file_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="escrows.{file_format}"'
+        return response
 
-        all_accepted = not transaction.participants.filter(has_accepted=False).exists()
-        if all_accepted:
-            transaction.status = EscrowStatus.ACTIVE
-            transaction.save(update_fields=['status'])
+    @query_budget(7)
+    @action(detail=True, methods=['post'], url_path='accept', permission_classes=[permissions.IsAuthenticated])
+    @idempotent
+    def accept(self, request, pk=None):
+        with db_transaction.atomic(savepoint=False):
+            transaction = self.get_object()
+            serializer = EscrowAcceptSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            token = serializer.validated_data.get('token')
+
+            if token:
+                try:
+                    participant_id = verify_invitation_token(token, transaction.pk)
+                except InvalidInvitationToken as exc:
+                    return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+                participant = transaction.participants.filter(pk=participant_id).first()
+            else:
+                participant = transaction.participants.filter(email=request.user.email).first()
+
+            if not participant:
+                return Response({'detail': 'Participant not found for this transaction.'}, status=status.HTTP_404_NOT_FOUND)
+            if participant.user_id is not None and participant.user_id != request.user.id:
+                return Response({'detail': 'This invitation has already been claimed.'}, status=status.HTTP_403_FORBIDDEN)
+
+            newly_accepted = not participant.has_accepted
+            if participant.user_id is None:
+                participant.user = request.user
+            participant.has_accepted = True
+            participant.save(update_fields=['user', 'has_accepted', 'updated_at'])
+
+            if newly_accepted:
+                accepted_count = models.F('accepted_count') + 1
+                transaction.accepted_count += 1
+                if can_transition(transaction, EscrowStatus.ACTIVE):
+                    transition(transaction, EscrowStatus.ACTIVE, actor=request.user, accepted_count=accepted_count)
+                else:
+                    EscrowTransaction.objects.filter(pk=transaction.pk).update(accepted_count=accepted_count)
 
         response_serializer = EscrowTransactionSerializer(transaction, context={'request': request})
         return Response(response_serializer.data, status=status.HTTP_200_OK)
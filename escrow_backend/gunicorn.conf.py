@@ -0,0 +1,19 @@
+import multiprocessing
+import os
+
+# Persistent connections are not reused across requests under ASGI (Django ticket #33497),
+# so this profile pools connections with psycopg_pool unless DB_POOL is set explicitly.
+os.environ.setdefault('DB_POOL', 'True')
+
+wsgi_app = 'escrow_backend.asgi:application'
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'uvicorn.workers.UvicornWorker')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 0))
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = os.getenv('GUNICORN_ERROR_LOG', '-')
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
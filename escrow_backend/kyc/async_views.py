@@ -0,0 +1,39 @@
+from rest_framework import status
+
+from escrow_backend.async_views import AsyncAPIView, json_response
+from escrow_backend.query_budget import query_budget
+
+from .serializers import KYCParticipantQuerySerializer, get_kyc_model_and_serializer
+from .services import aresolve_kyc, user_kyc_participants
+from .views import KYCViewSet
+
+
+class KYCMeView(AsyncAPIView):
+    fallback_view = KYCViewSet.as_view({'put': 'me'})
+
+    @query_budget(2)
+    async def get(self, request):
+        query = KYCParticipantQuerySerializer(data=request.GET)
+        if not query.is_valid():
+            return json_response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        participant = await user_kyc_participants(
+            request.user,
+            query.validated_data.get('participant'),
+            with_profile=True,
+        ).afirst()
+        if not participant:
+            return json_response(
+                {'detail': 'No escrow participation found for user.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        model_class, serializer_class = get_kyc_model_and_serializer(participant.role)
+        if not model_class:
+            return json_response(
+                {'detail': 'Unsupported participant role for KYC.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        instance = await aresolve_kyc(participant, model_class)
+        return json_response(serializer_class(instance).data)
@@ -0,0 +1,53 @@
+import base64
+import hashlib
+import hmac
+from functools import lru_cache
+
+from cryptography.fernet import Fernet, MultiFernet
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.encoding import force_bytes
+
+
+def _derive_key(setting, purpose):
+    if not settings.DEBUG:
+        raise ImproperlyConfigured(f'{setting} must be set when DEBUG is off.')
+    return hashlib.sha256(force_bytes(f'{purpose}:{settings.SECRET_KEY}')).digest()
+
+
+@lru_cache(maxsize=None)
+def get_fernet():
+    keys = settings.KYC_ENCRYPTION_KEYS or [
+        base64.urlsafe_b64encode(_derive_key('KYC_ENCRYPTION_KEYS', 'kyc.encryption')),
+    ]
+    return MultiFernet([Fernet(key) for key in keys])
+
+
+@lru_cache(maxsize=None)
+def get_blind_index_key():
+    if settings.KYC_BLIND_INDEX_KEY:
+        return force_bytes(settings.KYC_BLIND_INDEX_KEY)
+    return _derive_key('KYC_BLIND_INDEX_KEY', 'kyc.blind-index')
+
+
+def clear_key_cache():
+    get_fernet.cache_clear()
+    get_blind_index_key.cache_clear()
+
+
+def encrypt(value):
+    return get_fernet().encrypt(value.encode('utf-8')).decode('ascii')
+
+
+def decrypt(token):
+    return get_fernet().decrypt(token.encode('ascii')).decode('utf-8')
+
+
+def keyed_digest(value):
+    return hmac.new(get_blind_index_key(), force_bytes(value), hashlib.sha256).hexdigest()
+
+
+def blind_index(value):
+    if value is None or value == '':
+        return None
+    return keyed_digest(' '.join(str(value).split()).upper())
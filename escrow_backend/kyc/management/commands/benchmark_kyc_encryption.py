@@ -0,0 +1,36 @@
+import secrets
+import time
+
+from django.core.management.base import BaseCommand
+
+from kyc.crypto import blind_index, clear_key_cache, decrypt, encrypt, get_fernet
+
+
+class Command(BaseCommand):
+    help = 'Measure KYC field encryption, decryption and blind-index throughput.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        values = [secrets.token_hex(8).upper() for _ in range(rows)]
+        get_fernet()
+
+        tokens = self.measure('encrypt', rows, lambda: [encrypt(value) for value in values])
+        self.measure('decrypt', rows, lambda: [decrypt(token) for token in tokens])
+        self.measure('decrypt, keys rebuilt per row', rows, lambda: [self.decrypt_cold(token) for token in tokens])
+        self.measure('blind index', rows, lambda: [blind_index(value) for value in values])
+
+    def decrypt_cold(self, token):
+        clear_key_cache()
+        return decrypt(token)
+
+    def measure(self, label, rows, run):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'{label}: {elapsed * 1000:.1f} ms per {rows} rows ({rows / elapsed:,.0f} rows/sec)'
+        )
+        return result
@@ -0,0 +1,168 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:08
+
+import hashlib
+import json
+
+import django.db.models.deletion
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+
+PROFILE_FIELDS = ('full_legal_name', 'national_id_number', 'dob', 'address', 'occupation')
+
+
+def profile_fingerprint(data):
+    payload = json.dumps([data.get(field) for field in PROFILE_FIELDS], cls=DjangoJSONEncoder)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def deduplicate_kyc_profiles(apps, schema_editor):
+    KYCProfile = apps.get_model('kyc', 'KYCProfile')
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    users_by_email = {}
+    profiles = {}
+
+    for model_name in ('BuyerKYC', 'SellerKYC', 'BrokerKYC'):
+        KYCModel = apps.get_model('kyc', model_name)
+        records = KYCModel.objects.select_related('participant').order_by('created_at', 'id')
+        for record in records.iterator(chunk_size=2000):
+            participant = record.participant
+            user_id = participant.user_id
+            if user_id is None:
+                if participant.email not in users_by_email:
+                    users_by_email[participant.email] = (
+                        User.objects.filter(email=participant.email).values_list('pk', flat=True).first()
+                    )
+                user_id = users_by_email[participant.email]
+            if user_id is None:
+                raise ValueError(
+                    f'{model_name} {record.pk} belongs to participant {participant.pk}, which has no user account.'
+                )
+
+            data = {field: getattr(record, field) for field in PROFILE_FIELDS}
+            key = (user_id, profile_fingerprint(data))
+            if key not in profiles:
+                profiles[key] = KYCProfile.objects.create(user_id=user_id, fingerprint=key[1], **data)
+            record.profile = profiles[key]
+            record.save(update_fields=['profile'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KYCProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(editable=False, max_length=64)),
+                ('full_legal_name', models.CharField(max_length=255)),
+                ('national_id_number', models.CharField(max_length=100)),
+                ('dob', models.DateField()),
+                ('address', models.TextField()),
+                ('occupation', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='kyc_profiles', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-updated_at'], name='kyc_profile_user_updated_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'fingerprint'), name='unique_kyc_profile_per_user')],
+            },
+        ),
+        migrations.AddField(
+            model_name='brokerkyc',
+            name='profile',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_records', to='kyc.kycprofile'),
+        ),
+        migrations.AddField(
+            model_name='buyerkyc',
+            name='profile',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_records', to='kyc.kycprofile'),
+        ),
+        migrations.AddField(
+            model_name='sellerkyc',
+            name='profile',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_records', to='kyc.kycprofile'),
+        ),
+        migrations.RunPython(deduplicate_kyc_profiles, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='brokerkyc',
+            name='full_legal_name',
+        ),
+        migrations.RemoveField(
+            model_name='brokerkyc',
+            name='national_id_number',
+        ),
+        migrations.RemoveField(
+            model_name='brokerkyc',
+            name='dob',
+        ),
+        migrations.RemoveField(
+            model_name='brokerkyc',
+            name='address',
+        ),
+        migrations.RemoveField(
+            model_name='brokerkyc',
+            name='occupation',
+        ),
+        migrations.RemoveField(
+            model_name='buyerkyc',
+            name='full_legal_name',
+        ),
+        migrations.RemoveField(
+            model_name='buyerkyc',
+            name='national_id_number',
+        ),
+        migrations.RemoveField(
+            model_name='buyerkyc',
+            name='dob',
+        ),
+        migrations.RemoveField(
+            model_name='buyerkyc',
+            name='address',
+        ),
+        migrations.RemoveField(
+            model_name='buyerkyc',
+            name='occupation',
+        ),
+        migrations.RemoveField(
+            model_name='sellerkyc',
+            name='full_legal_name',
+        ),
+        migrations.RemoveField(
+            model_name='sellerkyc',
+            name='national_id_number',
+        ),
+        migrations.RemoveField(
+            model_name='sellerkyc',
+            name='dob',
+        ),
+        migrations.RemoveField(
+            model_name='sellerkyc',
+            name='address',
+        ),
+        migrations.RemoveField(
+            model_name='sellerkyc',
+            name='occupation',
+        ),
+        migrations.AlterField(
+            model_name='brokerkyc',
+            name='profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_records', to='kyc.kycprofile'),
+        ),
+        migrations.AlterField(
+            model_name='buyerkyc',
+            name='profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_records', to='kyc.kycprofile'),
+        ),
+        migrations.AlterField(
+            model_name='sellerkyc',
+            name='profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_records', to='kyc.kycprofile'),
+        ),
+    ]
@@ -0,0 +1,179 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:11
+
+import base64
+import hashlib
+import hmac
+import json
+
+import kyc.fields
+from cryptography.fernet import Fernet, MultiFernet
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations
+from django.utils.encoding import force_bytes
+from django.utils.functional import cached_property
+
+BATCH_SIZE = 2000
+PROFILE_FIELDS = ('full_legal_name', 'national_id_number', 'dob', 'address', 'occupation')
+TAX_ID_MODELS = ('BuyerKYC', 'SellerKYC')
+
+
+class Keys:
+    def derive(self, setting, purpose):
+        if not settings.DEBUG:
+            raise ImproperlyConfigured(f'{setting} must be set when DEBUG is off.')
+        return hashlib.sha256(force_bytes(f'{purpose}:{settings.SECRET_KEY}')).digest()
+
+    @cached_property
+    def fernet(self):
+        keys = settings.KYC_ENCRYPTION_KEYS or [
+            base64.urlsafe_b64encode(self.derive('KYC_ENCRYPTION_KEYS', 'kyc.encryption')),
+        ]
+        return MultiFernet([Fernet(key) for key in keys])
+
+    @cached_property
+    def blind_index_key(self):
+        if settings.KYC_BLIND_INDEX_KEY:
+            return force_bytes(settings.KYC_BLIND_INDEX_KEY)
+        return self.derive('KYC_BLIND_INDEX_KEY', 'kyc.blind-index')
+
+    def encrypt(self, value):
+        return self.fernet.encrypt(value.encode('utf-8')).decode('ascii')
+
+    def decrypt(self, token):
+        return self.fernet.decrypt(token.encode('ascii')).decode('utf-8')
+
+    def keyed_digest(self, value):
+        return hmac.new(self.blind_index_key, force_bytes(value), hashlib.sha256).hexdigest()
+
+    def blind_index(self, value):
+        if value is None or value == '':
+            return None
+        return self.keyed_digest(' '.join(str(value).split()).upper())
+
+
+def _batches(cursor):
+    while True:
+        rows = cursor.fetchmany(BATCH_SIZE)
+        if not rows:
+            return
+        yield rows
+
+
+def _profile_payload(values):
+    data = dict(zip(PROFILE_FIELDS, values))
+    return json.dumps([data[field] for field in PROFILE_FIELDS], cls=DjangoJSONEncoder)
+
+
+def encrypt_existing_values(apps, schema_editor):
+    keys = Keys()
+    connection = schema_editor.connection
+    quote = connection.ops.quote_name
+
+    profile_table = quote(apps.get_model('kyc', 'KYCProfile')._meta.db_table)
+    columns = ', '.join(quote(field) for field in PROFILE_FIELDS)
+    national_id_position = PROFILE_FIELDS.index('national_id_number')
+    with connection.cursor() as reader, connection.cursor() as writer:
+        reader.execute(f'SELECT id, {columns} FROM {profile_table}')
+        for rows in _batches(reader):
+            updates = []
+            for pk, *values in rows:
+                national_id = values[national_id_position]
+                updates.append((
+                    keys.encrypt(national_id),
+                    keys.blind_index(national_id),
+                    keys.keyed_digest(_profile_payload(values)),
+                    pk,
+                ))
+            writer.executemany(
+                f'UPDATE {profile_table} SET {quote("national_id_number")} = %s, '
+                f'{quote("national_id_index")} = %s, {quote("fingerprint")} = %s WHERE id = %s',
+                updates,
+            )
+
+        for model_name in TAX_ID_MODELS:
+            table = quote(apps.get_model('kyc', model_name)._meta.db_table)
+            reader.execute(f'SELECT id, {quote("tax_id")} FROM {table} WHERE {quote("tax_id")} <> %s', [''])
+            for rows in _batches(reader):
+                writer.executemany(
+                    f'UPDATE {table} SET {quote("tax_id")} = %s, {quote("tax_id_index")} = %s WHERE id = %s',
+                    [(keys.encrypt(tax_id), keys.blind_index(tax_id), pk) for pk, tax_id in rows],
+                )
+
+
+def decrypt_existing_values(apps, schema_editor):
+    keys = Keys()
+    connection = schema_editor.connection
+    quote = connection.ops.quote_name
+
+    profile_table = quote(apps.get_model('kyc', 'KYCProfile')._meta.db_table)
+    columns = ', '.join(quote(field) for field in PROFILE_FIELDS)
+    national_id_position = PROFILE_FIELDS.index('national_id_number')
+    with connection.cursor() as reader, connection.cursor() as writer:
+        reader.execute(f'SELECT id, {columns} FROM {profile_table}')
+        for rows in _batches(reader):
+            updates = []
+            for pk, *values in rows:
+                values[national_id_position] = keys.decrypt(values[national_id_position])
+                payload = _profile_payload(values)
+                updates.append((
+                    values[national_id_position],
+                    hashlib.sha256(payload.encode('utf-8')).hexdigest(),
+                    pk,
+                ))
+            writer.executemany(
+                f'UPDATE {profile_table} SET {quote("national_id_number")} = %s, '
+                f'{quote("fingerprint")} = %s WHERE id = %s',
+                updates,
+            )
+
+        for model_name in TAX_ID_MODELS:
+            table = quote(apps.get_model('kyc', model_name)._meta.db_table)
+            reader.execute(f'SELECT id, {quote("tax_id")} FROM {table} WHERE {quote("tax_id")} <> %s', [''])
+            for rows in _batches(reader):
+                writer.executemany(
+                    f'UPDATE {table} SET {quote("tax_id")} = %s WHERE id = %s',
+                    [(keys.decrypt(tax_id), pk) for pk, tax_id in rows],
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc', '0002_kyc_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='buyerkyc',
+            name='tax_id_index',
+            field=kyc.fields.BlindIndexField(db_index=True, max_length=64, null=True, source='tax_id'),
+        ),
+        migrations.AddField(
+            model_name='kycprofile',
+            name='national_id_index',
+            field=kyc.fields.BlindIndexField(db_index=True, max_length=64, null=True, source='national_id_number'),
+        ),
+        migrations.AddField(
+            model_name='sellerkyc',
+            name='tax_id_index',
+            field=kyc.fields.BlindIndexField(db_index=True, max_length=64, null=True, source='tax_id'),
+        ),
+        migrations.AlterField(
+            model_name='buyerkyc',
+            name='tax_id',
+            field=kyc.fields.EncryptedTextField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='kycprofile',
+            name='national_id_number',
+            field=kyc.fields.EncryptedTextField(max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='sellerkyc',
+            name='tax_id',
+            field=kyc.fields.EncryptedTextField(blank=True, max_length=100, null=True),
+        ),
+        migrations.RunPython(encrypt_existing_values, decrypt_existing_values),
+    ]
@@ -1,7 +1,39 @@
+from django.conf import settings
 from django.db import models
 
 from escrows.models import EscrowParticipant, EscrowRole
 
+from .fields import BlindIndexField, EncryptedTextField
+
+
+class KYCProfile(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name='kyc_profiles',
+    )
+    fingerprint = models.CharField(max_length=64, editable=False)
+    full_legal_name = models.CharField(max_length=255)
+    national_id_number = EncryptedTextField(max_length=100)
+    national_id_index = BlindIndexField(source='national_id_number')
+    dob = models.DateField()
+    address = models.TextField()
+    occupation = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'fingerprint'], name='unique_kyc_profile_per_user'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-updated_at'], name='kyc_profile_user_updated_idx'),
+        ]
+
+    def __str__(self):
+        return f"KYCProfile(id={self.id}, user={self.user_id})"
+
 
 class BaseKYC(models.Model):
     participant = models.OneToOneField(
@@ -9,11 +41,7 @@ class BaseKYC(models.Model):
         on_delete=models.CASCADE,
         related_name='%(class)s',
     )
-    full_legal_name = models.CharField(max_length=255)
-    national_id_number = models.CharField(max_length=100)
-    dob = models.DateField()
-    address = models.TextField()
-    occupation = models.CharField(max_length=255)
+    profile = models.ForeignKey(KYCProfile, on_delete=models.PROTECT, related_name='%(class)s_records')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -27,12 +55,14 @@ class BaseKYC(models.Model):
 
 class BuyerKYC(BaseKYC):
     source_of_funds = models.CharField(max_length=255, blank=True, null=True)
-    tax_id = models.CharField(max_length=100, blank=True, null=True)
+    tax_id = EncryptedTextField(max_length=100, blank=True, null=True)
+    tax_id_index = BlindIndexField(source='tax_id')
 
 
 class SellerKYC(BaseKYC):
     source_of_funds = models.CharField(max_length=255, blank=True, null=True)
-    tax_id = models.CharField(max_length=100, blank=True, null=True)
+    tax_id = EncryptedTextField(max_length=100, blank=True, null=True)
+    tax_id_index = BlindIndexField(source='tax_id')
 
 
 class BrokerKYC(BaseKYC):
@@ -1,11 +1,17 @@
 from rest_framework import serializers
 
-from escrows.models import EscrowRole
+from escrows.models import EscrowParticipant, EscrowRole
 
 from .models import BrokerKYC, BuyerKYC, SellerKYC
+from .services import PROFILE_FIELDS, is_kyc_complete, resolve_profile
 
 
 class BaseKYCSerializer(serializers.ModelSerializer):
+    full_legal_name = serializers.CharField(source='profile.full_legal_name', max_length=255)
+    national_id_number = serializers.CharField(source='profile.national_id_number', max_length=100)
+    dob = serializers.DateField(source='profile.dob')
+    address = serializers.CharField(source='profile.address')
+    occupation = serializers.CharField(source='profile.occupation', max_length=255)
     participant_role = serializers.SerializerMethodField()
 
     class Meta:
@@ -26,6 +32,23 @@ class BaseKYCSerializer(serializers.ModelSerializer):
     def get_participant_role(self, obj):
         return obj.role
 
+    def resolve_profile(self, validated_data, instance=None):
+        profile_data = validated_data.pop('profile')
+        participant = validated_data.get('participant') or instance.participant
+        current = instance.profile if instance is not None and instance.profile_id else None
+        validated_data['profile'] = resolve_profile(
+            participant.user_id,
+            {field: profile_data[field] for field in PROFILE_FIELDS},
+            current=current,
+        )
+        return validated_data
+
+    def create(self, validated_data):
+        return super().create(self.resolve_profile(validated_data))
+
+    def update(self, instance, validated_data):
+        return super().update(instance, self.resolve_profile(validated_data, instance))
+
 
 class BuyerKYCSerializer(BaseKYCSerializer):
     class Meta(BaseKYCSerializer.Meta):
@@ -49,6 +72,35 @@ class BrokerKYCSerializer(BaseKYCSerializer):
         ]
 
 
+class KYCParticipantQuerySerializer(serializers.Serializer):
+    participant = serializers.IntegerField(required=False, min_value=1)
+
+
+class KYCLookupSerializer(serializers.Serializer):
+    national_id = serializers.CharField(max_length=100)
+
+
+class KYCParticipantStatusSerializer(serializers.ModelSerializer):
+    kyc_complete = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EscrowParticipant
+        fields = ['id', 'email', 'user', 'role', 'has_accepted', 'kyc_complete']
+        read_only_fields = fields
+
+    def get_kyc_complete(self, obj):
+        return is_kyc_complete(obj)
+
+
+class KYCParticipationSerializer(KYCParticipantStatusSerializer):
+    agreement_name = serializers.CharField(source='transaction.agreement_name', read_only=True)
+    escrow_status = serializers.CharField(source='transaction.status', read_only=True)
+
+    class Meta(KYCParticipantStatusSerializer.Meta):
+        fields = ['id', 'transaction', 'agreement_name', 'escrow_status', 'role', 'has_accepted', 'kyc_complete', 'created_at']
+        read_only_fields = fields
+
+
 def get_kyc_model_and_serializer(role):
     if role in [EscrowRole.BUYER]:
         return BuyerKYC, BuyerKYCSerializer
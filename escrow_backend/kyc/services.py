@@ -0,0 +1,104 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from escrows.models import EscrowParticipant, EscrowRole, EscrowTransaction
+
+from .crypto import blind_index, keyed_digest
+from .fields import EncryptedTextField
+from .models import BrokerKYC, BuyerKYC, KYCProfile, SellerKYC
+
+KYC_MODELS = (BuyerKYC, SellerKYC, BrokerKYC)
+PROFILE_FIELDS = ('full_legal_name', 'national_id_number', 'dob', 'address', 'occupation')
+
+
+def kyc_accessor(model_class):
+    return model_class._meta.get_field('participant').remote_field.get_accessor_name()
+
+
+def encrypted_record_fields():
+    return [
+        f'{kyc_accessor(model_class)}__{field.name}'
+        for model_class in KYC_MODELS
+        for field in model_class._meta.concrete_fields
+        if isinstance(field, EncryptedTextField)
+    ]
+
+
+def kyc_participants(with_profile=False):
+    accessors = [kyc_accessor(model_class) for model_class in KYC_MODELS]
+    if with_profile:
+        return EscrowParticipant.objects.select_related(*[f'{accessor}__profile' for accessor in accessors])
+    return EscrowParticipant.objects.select_related(*accessors).defer(*encrypted_record_fields())
+
+
+def user_kyc_participants(user, participant_id=None, with_profile=False):
+    queryset = kyc_participants(with_profile).filter(user=user)
+    if participant_id:
+        queryset = queryset.filter(pk=participant_id)
+    return queryset
+
+
+def broker_escrows(user):
+    brokerships = EscrowParticipant.objects.filter(
+        transaction=models.OuterRef('pk'),
+        user=user,
+        role__in=[EscrowRole.BROKER, EscrowRole.CO_BROKER],
+    )
+    return EscrowTransaction.objects.filter(models.Q(created_by=user) | models.Exists(brokerships))
+
+
+def participants_with_national_id(national_id):
+    profiles = KYCProfile.objects.filter(national_id_index=blind_index(national_id)).values('pk')
+    matches = models.Q()
+    for model_class in KYC_MODELS:
+        matches |= models.Q(**{f'{kyc_accessor(model_class)}__profile__in': profiles})
+    return kyc_participants().filter(matches)
+
+
+def is_kyc_complete(participant):
+    return any(getattr(participant, kyc_accessor(model_class), None) for model_class in KYC_MODELS)
+
+
+def profile_fingerprint(data):
+    payload = json.dumps([data.get(field) for field in PROFILE_FIELDS], cls=DjangoJSONEncoder)
+    return keyed_digest(payload)
+
+
+def latest_profiles(user_id):
+    return KYCProfile.objects.filter(user_id=user_id).order_by('-updated_at', '-id')
+
+
+def resolve_profile(user_id, data, current=None):
+    fingerprint = profile_fingerprint(data)
+    if current is not None and current.user_id == user_id and current.fingerprint == fingerprint:
+        return current
+
+    profile = KYCProfile(user_id=user_id, fingerprint=fingerprint, **data)
+    KYCProfile.objects.bulk_create(
+        [profile],
+        update_conflicts=True,
+        unique_fields=['user', 'fingerprint'],
+        update_fields=['updated_at'],
+    )
+    return profile
+
+
+def resolve_kyc(participant, model_class):
+    instance = getattr(participant, kyc_accessor(model_class), None)
+    if instance is not None:
+        return instance
+    return model_class(participant=participant)
+
+
+async def aresolve_kyc(participant, model_class):
+    instance = getattr(participant, kyc_accessor(model_class), None)
+    if instance is not None:
+        return instance
+
+    instance = model_class(participant=participant)
+    profile = await latest_profiles(participant.user_id).afirst()
+    if profile is not None:
+        instance.profile = profile
+    return instance
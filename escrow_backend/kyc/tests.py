@@ -0,0 +1,86 @@
+from cryptography.fernet import Fernet
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from escrow_backend.testing import QueryBudgetAssertionsMixin, authenticated_client
+from escrows.models import EscrowParticipant, EscrowRole, EscrowTransaction
+
+from .crypto import clear_key_cache
+from .models import BuyerKYC, KYCProfile
+
+KYC_PAYLOAD = {
+    'full_legal_name': 'Jane Buyer',
+    'national_id_number': 'AB 123 456',
+    'dob': '1990-01-01',
+    'address': '1 Main St',
+    'occupation': 'Engineer',
+    'source_of_funds': 'Savings',
+    'tax_id': 'TX-1',
+}
+
+
+@override_settings(KYC_ENCRYPTION_KEYS=[Fernet.generate_key().decode()], KYC_BLIND_INDEX_KEY='test-blind-index-key')
+class KYCTestCase(TestCase):
+    def setUp(self):
+        clear_key_cache()
+        self.addCleanup(clear_key_cache)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.broker = User.objects.create_user('broker@example.com', 'password123', is_broker=True)
+        cls.buyer = User.objects.create_user('buyer@example.com', 'password123')
+        cls.escrow = EscrowTransaction.objects.create(
+            created_by=cls.broker,
+            agreement_name='Agreement',
+            currency='USD',
+            transaction_type='PROPERTY_SALE',
+            property_type='HOUSE',
+            property_address='1 Main St',
+        )
+        cls.participant = EscrowParticipant.objects.create(
+            transaction=cls.escrow, user=cls.buyer, email=cls.buyer.email, role=EscrowRole.BUYER,
+        )
+
+
+class KYCRetentionTests(KYCTestCase):
+    def test_deleting_user_keeps_kyc_record_and_profile(self):
+        response = authenticated_client(self.buyer).put('/api/kyc/me/', KYC_PAYLOAD, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.buyer.delete()
+
+        record = BuyerKYC.objects.select_related('profile').get(participant=self.participant)
+        self.assertIsNone(record.profile.user_id)
+        self.assertEqual(record.profile.national_id_number, KYC_PAYLOAD['national_id_number'])
+        self.assertEqual(KYCProfile.objects.count(), 1)
+
+
+class QueryBudgetTests(QueryBudgetAssertionsMixin, KYCTestCase):
+    def test_list(self):
+        self.assertWithinQueryBudget(authenticated_client(self.buyer).get('/api/kyc/'))
+
+    def test_escrow_summary(self):
+        response = authenticated_client(self.broker).get(f'/api/kyc/escrows/{self.escrow.pk}/')
+        self.assertWithinQueryBudget(response)
+
+    def test_lookup(self):
+        admin = User.objects.create_superuser('admin@example.com', 'password123')
+        authenticated_client(self.buyer).put('/api/kyc/me/', KYC_PAYLOAD, format='json')
+        response = authenticated_client(admin).get('/api/kyc/lookup/', {'national_id': 'ab  123 456'})
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(len(response.data), 1)
+
+    def test_submit(self):
+        response = authenticated_client(self.buyer).put('/api/kyc/me/', KYC_PAYLOAD, format='json')
+        self.assertWithinQueryBudget(response)
+
+    def test_resubmit(self):
+        authenticated_client(self.buyer).put('/api/kyc/me/', KYC_PAYLOAD, format='json')
+        response = authenticated_client(self.buyer).put(
+            '/api/kyc/me/', {**KYC_PAYLOAD, 'occupation': 'Architect'}, format='json',
+        )
+        self.assertWithinQueryBudget(response)
+
+    def test_retrieve(self):
+        authenticated_client(self.buyer).put('/api/kyc/me/', KYC_PAYLOAD, format='json')
+        self.assertWithinQueryBudget(authenticated_client(self.buyer).get('/api/kyc/me/'))
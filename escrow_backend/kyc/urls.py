@@ -1,8 +1,12 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from .async_views import KYCMeView
 from .views import KYCViewSet
 
 router = DefaultRouter()
 router.register('kyc', KYCViewSet, basename='kyc')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path('kyc/me/', KYCMeView.as_view(), name='kyc-me'),
+] + router.urls
@@ -1,18 +1,40 @@
+from django.db import transaction as db_transaction
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from escrows.models import EscrowParticipant
+from escrow_backend.pagination import KeysetPagination
+from escrow_backend.query_budget import query_budget
 
-from .serializers import BrokerKYCSerializer, BuyerKYCSerializer, SellerKYCSerializer, get_kyc_model_and_serializer
+from .serializers import (
+    BuyerKYCSerializer,
+    KYCLookupSerializer,
+    KYCParticipantQuerySerializer,
+    KYCParticipantStatusSerializer,
+    KYCParticipationSerializer,
+    get_kyc_model_and_serializer,
+)
+from .services import (
+    broker_escrows,
+    kyc_participants,
+    participants_with_national_id,
+    resolve_kyc,
+    user_kyc_participants,
+)
 
 
 class KYCViewSet(viewsets.GenericViewSet):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = BuyerKYCSerializer
+    pagination_class = KeysetPagination
 
     def get_participant(self):
-        return EscrowParticipant.objects.filter(user=self.request.user).first()
+        if not hasattr(self, '_participant'):
+            query = KYCParticipantQuerySerializer(data=self.request.query_params)
+            query.is_valid(raise_exception=True)
+            participant_id = query.validated_data.get('participant')
+            self._participant = user_kyc_participants(self.request.user, participant_id, with_profile=True).first()
+        return self._participant
 
     def get_serializer_class(self):
         participant = self.get_participant()
@@ -31,10 +53,44 @@ class KYCViewSet(viewsets.GenericViewSet):
         if not model_class:
             return None
 
-        instance, _ = model_class.objects.get_or_create(participant=participant)
-        return instance
+        return resolve_kyc(participant, model_class)
 
-    @action(detail=False, methods=['get', 'put'], url_path='me')
+    @query_budget(2)
+    def list(self, request):
+        queryset = user_kyc_participants(request.user).select_related('transaction')
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(KYCParticipationSerializer(page, many=True).data)
+
+    @query_budget(3)
+    @action(detail=False, methods=['get'], url_path=r'escrows/(?P<escrow_id>[0-9]+)')
+    def escrow_summary(self, request, escrow_id=None):
+        escrow = broker_escrows(request.user).filter(pk=escrow_id).first()
+        if not escrow:
+            return Response({'detail': 'Escrow not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        participants = kyc_participants().filter(transaction=escrow).order_by('created_at', 'id')
+        statuses = KYCParticipantStatusSerializer(participants, many=True).data
+        return Response({
+            'escrow': escrow.pk,
+            'agreement_name': escrow.agreement_name,
+            'status': escrow.status,
+            'participant_count': len(statuses),
+            'complete_count': sum(1 for participant in statuses if participant['kyc_complete']),
+            'missing': [participant['id'] for participant in statuses if not participant['kyc_complete']],
+            'participants': statuses,
+        })
+
+    @query_budget(3)
+    @action(detail=False, methods=['get'], url_path='lookup', permission_classes=[permissions.IsAdminUser])
+    def lookup(self, request):
+        serializer = KYCLookupSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        participants = participants_with_national_id(serializer.validated_data['national_id'])
+        participants = participants.select_related('transaction').order_by('created_at', 'id')
+        return Response(KYCParticipationSerializer(participants, many=True).data)
+
+    @query_budget(4)
+    @action(detail=False, methods=['put'], url_path='me')
     def me(self, request):
         participant = self.get_participant()
         if not participant:
@@ -44,13 +100,9 @@ class KYCViewSet(viewsets.GenericViewSet):
         if not model_class:
             return Response({'detail': 'Unsupported participant role for KYC.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        instance, _ = model_class.objects.get_or_create(participant=participant)
-
-        if request.method.lower() == 'get':
-            serializer = serializer_class(instance)
-            return Response(serializer.data)
-
+        instance = resolve_kyc(participant, model_class)
         serializer = serializer_class(instance, data=request.data, partial=False)
         serializer.is_valid(raise_exception=True)
-        serializer.save(participant=participant)
+        with db_transaction.atomic():
+            serializer.save(participant=participant)
         return Response(serializer.data)
@@ -3,6 +3,7 @@ import { Navigate, Route, Routes } from 'react-router-dom';
 import NavBar from './components/NavBar';
 import ProtectedRoute from './components/ProtectedRoute';
 import DashboardPage from './pages/DashboardPage';
+import EscrowAcceptPage from './pages/EscrowAcceptPage';
 import EscrowCreatePage from './pages/EscrowCreatePage';
 import EscrowInvitePage from './pages/EscrowInvitePage';
 import BecomeBrokerPage from './pages/BecomeBrokerPage';
@@ -41,6 +42,14 @@ const App: React.FC = () => {
             </ProtectedRoute>
           }
         />
+        <Route
+          path="/escrows/:id/accept"
+          element={
+            <ProtectedRoute>
+              <EscrowAcceptPage />
+            </ProtectedRoute>
+          }
+        />
         <Route
           path="/become-broker"
           element={
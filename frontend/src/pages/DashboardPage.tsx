@@ -1,6 +1,6 @@
 import React from 'react';
 import { Link } from 'react-router-dom';
-import { useQuery } from '@tanstack/react-query';
+import { useInfiniteQuery } from '@tanstack/react-query';
 import api from '../api/client';
 import { useAuth } from '@/context/AuthContext';
 
@@ -13,23 +13,36 @@ type EscrowTransaction = {
   role: 'BROKER' | 'BUYER' | 'SELLER' | string;
 };
 
+type EscrowPage = {
+  next: string | null;
+  results: EscrowTransaction[];
+};
+
 const roleBadgeStyles: Record<string, React.CSSProperties> = {
   BROKER: { backgroundColor: '#e0f2fe', color: '#075985', borderColor: '#7dd3fc' },
   BUYER: { backgroundColor: '#ecfdf3', color: '#166534', borderColor: '#86efac' },
   SELLER: { backgroundColor: '#fef9c3', color: '#854d0e', borderColor: '#fef08a' },
 };
 
+const nextCursor = (next: string | null) => (next ? new URL(next).searchParams.get('cursor') : null);
+
 const DashboardPage: React.FC = () => {
   const { currentUser } = useAuth();
 
-  const { data, isLoading, isError } = useQuery({
+  const { data, isLoading, isError, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
     queryKey: ['escrows'],
-    queryFn: async () => {
-      const response = await api.get<EscrowTransaction[]>('/escrows/');
+    queryFn: async ({ pageParam }) => {
+      const response = await api.get<EscrowPage>('/escrows/', {
+        params: pageParam ? { cursor: pageParam } : undefined,
+      });
       return response.data;
     },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => nextCursor(lastPage.next),
   });
 
+  const escrows = data?.pages.flatMap((page) => page.results) ?? [];
+
   return (
     <div style={{ padding: '24px', display: 'flex', flexDirection: 'column', gap: '16px' }}>
       <div style={{ display: 'flex', alignItems: 'center', justifyContent: 'space-between', gap: '12px' }}>
@@ -67,8 +80,8 @@ const DashboardPage: React.FC = () => {
 
         {!isLoading && !isError && (
           <div style={{ display: 'flex', flexDirection: 'column', gap: '12px' }}>
-            {data?.length ? (
-              data.map((escrow) => {
+            {escrows.length ? (
+              escrows.map((escrow) => {
                 const badgeStyle = roleBadgeStyles[escrow.role] ?? {
                   backgroundColor: '#f3f4f6',
                   color: '#111827',
@@ -122,6 +135,25 @@ const DashboardPage: React.FC = () => {
             ) : (
               <p style={{ margin: 0, color: '#6b7280' }}>You are not part of any escrows yet.</p>
             )}
+            {hasNextPage && (
+              <button
+                type="button"
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+                style={{
+                  alignSelf: 'center',
+                  padding: '8px 14px',
+                  borderRadius: 8,
+                  border: '1px solid #d1d5db',
+                  backgroundColor: '#fff',
+                  color: '#111827',
+                  fontWeight: 600,
+                  cursor: 'pointer',
+                }}
+              >
+                {isFetchingNextPage ? 'Loading...' : 'Load more'}
+              </button>
+            )}
           </div>
         )}
       </div>
@@ -0,0 +1,54 @@
+import React from 'react';
+import { isAxiosError } from 'axios';
+import { useMutation } from '@tanstack/react-query';
+import { Link, useParams, useSearchParams } from 'react-router-dom';
+import api from '../api/client';
+
+const acceptInvitation = async ({ id, token }: { id: string; token: string }) => {
+  const response = await api.post(`/escrows/${id}/accept/`, { token });
+  return response.data;
+};
+
+const errorMessage = (error: unknown): string => {
+  if (isAxiosError<{ detail?: string }>(error) && error.response?.data?.detail) {
+    return error.response.data.detail;
+  }
+  return 'We could not accept this invitation. Please try again.';
+};
+
+const EscrowAcceptPage: React.FC = () => {
+  const { id } = useParams<{ id: string }>();
+  const [searchParams] = useSearchParams();
+  const token = searchParams.get('token');
+  const mutation = useMutation({ mutationFn: acceptInvitation });
+
+  const handleSubmit = (event: React.FormEvent<HTMLFormElement>) => {
+    event.preventDefault();
+    if (id && token) {
+      mutation.mutate({ id, token });
+    }
+  };
+
+  return (
+    <div style={{ padding: '24px' }}>
+      <h1>Accept Invitation</h1>
+      {!token ? (
+        <p>This invitation link is missing its token. Open the link from your invitation email again.</p>
+      ) : mutation.isSuccess ? (
+        <p>
+          You have joined <strong>{mutation.data.agreement_name}</strong>. <Link to="/dashboard">Go to dashboard</Link>
+        </p>
+      ) : (
+        <form onSubmit={handleSubmit} style={{ display: 'flex', flexDirection: 'column', gap: '12px', maxWidth: 420 }}>
+          <p>You have been invited to join an escrow. Accept the invitation to link it to your account.</p>
+          <button type="submit" disabled={mutation.isPending} style={{ padding: '10px 12px', borderRadius: '6px', border: '1px solid #111827', background: '#111827', color: '#fff', cursor: 'pointer' }}>
+            {mutation.isPending ? 'Accepting...' : 'Accept invitation'}
+          </button>
+          {mutation.isError && <p style={{ color: '#b91c1c' }}>{errorMessage(mutation.error)}</p>}
+        </form>
+      )}
+    </div>
+  );
+};
+
+export default EscrowAcceptPage;
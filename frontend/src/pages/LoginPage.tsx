@@ -12,8 +12,8 @@ const LoginPage: React.FC = () => {
   const handleSubmit = async (event: React.FormEvent<HTMLFormElement>) => {
     event.preventDefault();
     await login({ email, password });
-    const from = (location.state as { from?: Location })?.from?.pathname ?? '/dashboard';
-    navigate(from, { replace: true });
+    const from = (location.state as { from?: Location })?.from;
+    navigate(from ? `${from.pathname}${from.search}` : '/dashboard', { replace: true });
   };
 
   return (
@@ -32,7 +32,7 @@ const LoginPage: React.FC = () => {
           {isAuthenticating ? 'Signing in...' : 'Login'}
         </button>
         <p>
-          No account? <Link to="/register">Create one</Link>
+          No account? <Link to="/register" state={location.state}>Create one</Link>
         </p>
       </form>
     </div>
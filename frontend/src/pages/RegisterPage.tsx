@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import { Link, useNavigate } from 'react-router-dom';
+import { Link, Location, useLocation, useNavigate } from 'react-router-dom';
 import { useMutation } from '@tanstack/react-query';
 import { registerRequest } from '@/api/auth';
 import { useAuth } from '@/context/AuthContext';
@@ -8,6 +8,7 @@ import { RegisterPayload } from '@/types/auth';
 const RegisterPage: React.FC = () => {
   const [form, setForm] = useState<RegisterPayload>({ email: '', password: '', name: '' });
   const navigate = useNavigate();
+  const location = useLocation();
   const { applyAuthResponse } = useAuth();
   const registerMutation = useMutation({ mutationFn: registerRequest });
 
@@ -19,7 +20,8 @@ const RegisterPage: React.FC = () => {
     event.preventDefault();
     const response = await registerMutation.mutateAsync(form);
     applyAuthResponse(response);
-    navigate('/dashboard');
+    const from = (location.state as { from?: Location })?.from;
+    navigate(from ? `${from.pathname}${from.search}` : '/dashboard');
   };
 
   return (
@@ -42,7 +44,7 @@ const RegisterPage: React.FC = () => {
           {registerMutation.isPending ? 'Creating account...' : 'Register'}
         </button>
         <p>
-          Already registered? <Link to="/login">Login</Link>
+          Already registered? <Link to="/login" state={location.state}>Login</Link>
         </p>
       </form>
     </div>